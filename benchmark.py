@@ -5,15 +5,30 @@ Tests different data types, file sizes, algorithms, and compression levels
 """
 
 import asyncio
+import contextlib
+import itertools
 import json
+import math
+import os
 import random
-import statistics
+import re
 import tempfile
 import time
-from dataclasses import dataclass, asdict
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from io import BytesIO
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
+
+try:
+    import msgspec
+
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
 
 from rich.console import Console
 from rich.panel import Panel
@@ -24,7 +39,7 @@ from rich.table import Table
 from tar_compressor import AsyncTarProcessor, CompressionType, CompressionChecker
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Single benchmark result"""
     algorithm: str
@@ -37,6 +52,18 @@ class BenchmarkResult:
     compression_time: float
     compression_ratio: float
     speed_mbps: float
+    threads: int = 1
+    time_stdev: float = 0.0  # Sample standard deviation of compression_time
+
+
+def _default_thread_counts() -> Dict[CompressionType, List[int]]:
+    """Single-threaded and all-cores runs for every algorithm that can use them"""
+    counts = sorted({1, os.cpu_count() or 1})
+    return {
+        algo: list(counts)
+        for algo in CompressionType
+        if AsyncTarProcessor.supports_threads(algo)
+    }
 
 
 @dataclass
@@ -48,46 +75,109 @@ class BenchmarkConfig:
     file_sizes: List[Tuple[str, int]]
     file_counts: List[int]
     iterations: int = 3
+    io_mode: str = "memory"  # "memory" compresses payloads in RAM, "disk" via temp files
+    jobs: int = 1  # Worker processes, 1 = sequential for clean timings
+    seed: Optional[int] = None  # Fixed seed makes payloads reproducible across runs
+    # Thread counts per algorithm, algorithms not listed run single-threaded
+    threads_per_algo: Dict[CompressionType, List[int]] = field(default_factory=_default_thread_counts)
+
+    def algorithms_with_levels(self) -> List[Tuple[CompressionType, int]]:
+        """Expand each algorithm into its (algorithm, level) pairs"""
+        return [
+            (algorithm, level)
+            for algorithm in self.algorithms
+            for level in self.compression_levels.get(algorithm, [0])
+        ]
 
 
-class DataGenerator:
-    """Generate different types of test data"""
+@dataclass
+class BenchmarkJob:
+    """One (algorithm, level, data shape) combination to measure"""
+    algorithm: CompressionType
+    level: int
+    data_type: str
+    file_size: int
+    file_count: int
+    iterations: int
+    io_mode: str
+    threads: int = 1
 
-    @staticmethod
-    def generate_random_text(size: int) -> bytes:
+
+class DataGenerator:
+    """Generate different types of test data from a private random stream"""
+
+    # Text alphabet, and a 256-entry table folding random bytes onto it
+    TEXT_CHARS = b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 \n\t.,!?'
+    TEXT_TABLE = (TEXT_CHARS * (256 // len(TEXT_CHARS) + 1))[:256]
+
+    # Sparse data: ~10% of byte values select a position, zero maps to one
+    SPARSE_MASK_TABLE = bytes(0xFF if i < 26 else 0x00 for i in range(256))
+    NONZERO_TABLE = bytes([1]) + bytes(range(1, 256))
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the generator
+
+        Args:
+            seed: Base seed, None draws a fresh one from the OS
+        """
+        self.seed = seed
+        # Own Random instance, not shared with the global module state
+        self.rng = random.Random(seed)
+
+    def reseed(self, *key):
+        """
+        Restart the stream for one payload when a base seed is set
+
+        Args:
+            key: Values identifying the payload, e.g. data type, size and index
+        """
+        if self.seed is not None:
+            self.rng.seed(":".join(map(str, (self.seed, *key))))
+
+    def generate_random_text(self, size: int) -> bytes:
         """Generate random text data (ASCII printable characters)"""
-        chars = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 \n\t.,!?'
-        return ''.join(random.choice(chars) for _ in range(size)).encode('utf-8')
+        return self.rng.randbytes(size).translate(self.TEXT_TABLE)
 
-    @staticmethod
-    def generate_repetitive_text(size: int) -> bytes:
+    # ASCII pattern kept as bytes, so no str is built or encoded
+    REPETITIVE_PATTERN = b"This is a repetitive pattern that should compress very well. " * 10
+
+    def generate_repetitive_text(self, size: int) -> bytes:
         """Generate highly repetitive text data"""
-        pattern = "This is a repetitive pattern that should compress very well. " * 10
-        repetitions = size // len(pattern) + 1
-        return (pattern * repetitions)[:size].encode('utf-8')
+        repetitions = size // len(self.REPETITIVE_PATTERN) + 1
+        return (self.REPETITIVE_PATTERN * repetitions)[:size]
 
-    @staticmethod
-    def generate_json_like(size: int) -> bytes:
+    # One serialized record, laid out exactly as json.dumps would print it
+    JSON_TEMPLATE = ('{"id": %d, "name": "User_%d", "email": "user%d@example.com", '
+                     '"active": %s, "score": %s, "tags": [%s]}\n')
+    JSON_TAGS = [', '.join(f'"tag{i}"' for i in range(n)) for n in range(1, 6)]
+
+    def generate_json_like(self, size: int) -> bytes:
         """Generate JSON-like structured data"""
+        rng = self.rng
         data = []
         current_size = 0
+        # Records average ~130 bytes; draw every field for a whole batch at once
+        batch = max(size // 128, 16)
         while current_size < size:
-            record = {
-                "id": random.randint(1000, 9999),
-                "name": f"User_{random.randint(1, 1000)}",
-                "email": f"user{random.randint(1, 1000)}@example.com",
-                "active": random.choice([True, False]),
-                "score": round(random.uniform(0, 100), 2),
-                "tags": [f"tag{i}" for i in range(random.randint(1, 5))]
-            }
-            record_str = json.dumps(record) + "\n"
-            data.append(record_str)
-            current_size += len(record_str)
+            records = [
+                self.JSON_TEMPLATE % fields
+                for fields in zip(
+                    rng.choices(range(1000, 10000), k=batch),
+                    rng.choices(range(1, 1001), k=batch),
+                    rng.choices(range(1, 1001), k=batch),
+                    rng.choices(('true', 'false'), k=batch),
+                    # Formatted straight to two decimals, no float rounding/repr
+                    [f"{rng.uniform(0, 100):.2f}" for _ in range(batch)],
+                    rng.choices(self.JSON_TAGS, k=batch)
+                )
+            ]
+            data.extend(records)
+            current_size += sum(map(len, records))
 
         return ''.join(data)[:size].encode('utf-8')
 
-    @staticmethod
-    def generate_log_like(size: int) -> bytes:
+    def generate_log_like(self, size: int) -> bytes:
         """Generate log-like data"""
         log_levels = ['INFO', 'DEBUG', 'WARN', 'ERROR']
         messages = [
@@ -100,33 +190,48 @@ class DataGenerator:
             'Active connections: {}'
         ]
 
+        rng = self.rng
         logs = []
         current_size = 0
+        # Lines average ~70 bytes; draw levels, messages and numbers per batch
+        batch = max(size // 64, 16)
         while current_size < size:
-            timestamp = datetime.now().isoformat()
-            level = random.choice(log_levels)
-            message = random.choice(messages).format(random.randint(10, 1000))
-            log_line = f"[{timestamp}] [{level}] {message}\n"
-            logs.append(log_line)
-            current_size += len(log_line)
+            levels = rng.choices(log_levels, k=batch)
+            chosen = rng.choices(messages, k=batch)
+            numbers = rng.choices(range(10, 1001), k=batch)
+            lines = [
+                f"[{datetime.now().isoformat()}] [{level}] {message.format(number)}\n"
+                for level, message, number in zip(levels, chosen, numbers)
+            ]
+            logs.extend(lines)
+            current_size += sum(map(len, lines))
 
         return ''.join(logs)[:size].encode('utf-8')
 
-    @staticmethod
-    def generate_binary_random(size: int) -> bytes:
+    def generate_binary_random(self, size: int) -> bytes:
         """Generate completely random binary data"""
-        return bytes(random.randint(0, 255) for _ in range(size))
+        if self.seed is None:
+            # Nothing to reproduce, take the bytes straight from the kernel
+            return os.urandom(size)
+        return self.rng.randbytes(size)
 
-    @staticmethod
-    def generate_binary_sparse(size: int) -> bytes:
+    # Sparse data is built in blocks of this size to bound temporary memory
+    SPARSE_BLOCK_SIZE = 1024 * 1024
+
+    def generate_binary_sparse(self, size: int) -> bytes:
         """Generate sparse binary data (lots of zeros)"""
-        data = bytearray(size)
-        # Fill only 10% with random data
-        num_values = size // 10
-        positions = random.sample(range(size), num_values)
-        for pos in positions:
-            data[pos] = random.randint(1, 255)
-        return bytes(data)
+        # Fill ~10% of positions with values 1-255: AND a sparse 0x00/0xFF
+        # mask with non-zero random bytes, done as one big-int operation per
+        # block. Blocks keep the mask/value/int temporaries at block size
+        # and the join allocates the result once, without zero-filling it
+        blocks = []
+        for offset in range(0, size, self.SPARSE_BLOCK_SIZE):
+            n = min(self.SPARSE_BLOCK_SIZE, size - offset)
+            mask = self.rng.randbytes(n).translate(self.SPARSE_MASK_TABLE)
+            values = self.rng.randbytes(n).translate(self.NONZERO_TABLE)
+            data = int.from_bytes(mask, 'big') & int.from_bytes(values, 'big')
+            blocks.append(data.to_bytes(n, 'big'))
+        return b''.join(blocks)
 
 
 class CompressionBenchmark:
@@ -138,6 +243,7 @@ class CompressionBenchmark:
         CompressionType.BZIP2: [1, 5, 9],  # 1=fastest, 9=best compression
         CompressionType.XZ: [0, 3, 6, 9],  # 0=fastest, 9=best compression
         CompressionType.LZ4: [1, 3, 9],  # LZ4 levels
+        CompressionType.ZSTD: [1, 3, 15, 22],  # real-time / balanced / archival / max
         CompressionType.NONE: [0]  # No compression
     }
 
@@ -150,9 +256,23 @@ class CompressionBenchmark:
         ("10MB", 10 * 1024 * 1024)
     ]
 
-    def __init__(self):
+    # Size input such as "512", "64K", "5 MB"; unit letter -> multiplier
+    SIZE_PATTERN = re.compile(r'(\d+)\s*([KMGT]?)B?')
+    SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+
+    # Jobs smaller than this get one discarded warm-up run before measuring
+    WARMUP_THRESHOLD = 1024 * 1024
+
+    # Upper bound for generated payload bytes kept between tests
+    PAYLOAD_CACHE_LIMIT = 512 * 1024 * 1024
+
+    def __init__(self, seed: Optional[int] = None):
         self.console = Console()
         self.results: List[BenchmarkResult] = []
+        self.generator = DataGenerator(seed)
+        # (data_type, file_size) -> generated file payloads, least recent first
+        self._payload_cache: "OrderedDict[Tuple[str, int], List[bytes]]" = OrderedDict()
+        self._payload_cache_size = 0
 
     def get_interactive_config(self) -> BenchmarkConfig:
         """Get benchmark configuration interactively"""
@@ -250,16 +370,11 @@ class CompressionBenchmark:
                 if size_str.lower() == 'done':
                     break
 
-                # Parse size
-                size_str = size_str.upper()
-                if size_str.endswith('KB'):
-                    size = int(size_str[:-2]) * 1024
-                elif size_str.endswith('MB'):
-                    size = int(size_str[:-2]) * 1024 * 1024
-                elif size_str.endswith('GB'):
-                    size = int(size_str[:-2]) * 1024 * 1024 * 1024
-                else:
-                    size = int(size_str)
+                size_str = size_str.strip().upper()
+                size = self._parse_size(size_str)
+                if size is None:
+                    self.console.print("[red]Invalid size, use a number with an optional K/M/G/T unit[/red]")
+                    continue
 
                 file_sizes.append((size_str, size))
 
@@ -271,6 +386,38 @@ class CompressionBenchmark:
         )
         file_counts = [int(x.strip()) for x in file_counts_str.split(',')]
 
+        # I/O mode
+        self.console.print("\n[cyan]Select I/O mode:[/cyan]")
+        self.console.print("memory - compress payloads held in RAM (measures the algorithm)")
+        self.console.print("disk   - write test files and compress them (includes filesystem I/O)")
+        io_mode = Prompt.ask("I/O mode", choices=["memory", "disk"], default="memory")
+
+        # Worker processes
+        jobs_str = Prompt.ask(
+            f"\n[cyan]Worker processes (1 = sequential, cleanest timings; max {os.cpu_count()})[/cyan]",
+            default="1"
+        )
+        jobs = max(int(jobs_str), 1) if jobs_str.isdigit() else 1
+
+        # Thread counts for algorithms that can compress in parallel
+        threads_per_algo = _default_thread_counts()
+        threaded_algos = [algo for algo in selected_algos if algo in threads_per_algo]
+        if threaded_algos:
+            threads_str = Prompt.ask(
+                f"\n[cyan]Thread counts for {', '.join(a.name for a in threaded_algos)} "
+                f"(comma-separated)[/cyan]",
+                default=",".join(map(str, threads_per_algo[threaded_algos[0]]))
+            )
+            thread_counts = sorted({max(int(x.strip()), 1) for x in threads_str.split(',')})
+            threads_per_algo = {algo: thread_counts for algo in threaded_algos}
+
+        # Random seed
+        seed_str = Prompt.ask(
+            "\n[cyan]Random seed for test data (empty = different data each run)[/cyan]",
+            default=""
+        )
+        seed = int(seed_str) if seed_str.strip().lstrip('-').isdigit() else None
+
         # Iterations
         while True:
             iterations_str = Prompt.ask(
@@ -292,9 +439,56 @@ class CompressionBenchmark:
             data_types=data_types,
             file_sizes=file_sizes,
             file_counts=file_counts,
-            iterations=iterations
+            iterations=iterations,
+            io_mode=io_mode,
+            jobs=jobs,
+            seed=seed,
+            threads_per_algo=threads_per_algo
         )
 
+    def _get_payloads(self, data_type: str, file_size: int, file_count: int) -> List[bytes]:
+        """
+        Get test file payloads, generating only what the cache lacks
+
+        Args:
+            data_type: Data generator name
+            file_size: Size of each payload in bytes
+            file_count: Number of payloads needed
+
+        Returns:
+            List of file_count payloads
+        """
+        generator_map = {
+            'random_text': self.generator.generate_random_text,
+            'repetitive_text': self.generator.generate_repetitive_text,
+            'json_like': self.generator.generate_json_like,
+            'log_like': self.generator.generate_log_like,
+            'binary_random': self.generator.generate_binary_random,
+            'binary_sparse': self.generator.generate_binary_sparse
+        }
+
+        key = (data_type, file_size)
+        payloads = self._payload_cache.pop(key, [])
+
+        if len(payloads) < file_count:
+            generator = generator_map[data_type]
+            new_payloads = []
+            for index in range(len(payloads), file_count):
+                # Seeded runs tie each payload to its shape and position, so the
+                # bytes don't depend on cache state or which worker builds them
+                self.generator.reseed(data_type, file_size, index)
+                new_payloads.append(generator(file_size))
+            payloads.extend(new_payloads)
+            self._payload_cache_size += sum(map(len, new_payloads))
+
+        # Re-insert as most recently used, then evict the oldest shapes
+        self._payload_cache[key] = payloads
+        while self._payload_cache_size > self.PAYLOAD_CACHE_LIMIT and len(self._payload_cache) > 1:
+            _, evicted = self._payload_cache.popitem(last=False)
+            self._payload_cache_size -= sum(map(len, evicted))
+
+        return payloads[:file_count]
+
     async def run_single_benchmark(
             self,
             algorithm: CompressionType,
@@ -302,102 +496,64 @@ class CompressionBenchmark:
             data_type: str,
             file_size: int,
             file_count: int,
-            tmpdir: Path
+            slot_dir: Path,
+            io_mode: str = "memory",
+            threads: int = 1
     ) -> BenchmarkResult:
-        """Run a single benchmark test"""
-        # Generate test data
-        generator_map = {
-            'random_text': DataGenerator.generate_random_text,
-            'repetitive_text': DataGenerator.generate_repetitive_text,
-            'json_like': DataGenerator.generate_json_like,
-            'log_like': DataGenerator.generate_log_like,
-            'binary_random': DataGenerator.generate_binary_random,
-            'binary_sparse': DataGenerator.generate_binary_sparse
-        }
-
-        generator = generator_map[data_type]
-
-        # Create test files
-        test_dir = tmpdir / f"test_{algorithm.value}_{level}_{data_type}"
-        test_dir.mkdir(exist_ok=True)
-
-        total_size = 0
-        for i in range(file_count):
-            file_path = test_dir / f"file_{i}.dat"
-            data = generator(file_size)
-            file_path.write_bytes(data)
-            total_size += len(data)
-
-        # Setup compression with level
-        if algorithm == CompressionType.GZIP:
-            # Monkey patch gzip compression level
-            import gzip
-            original_open = gzip.open
-
-            def patched_open(*args, **kwargs):
-                if 'compresslevel' not in kwargs:
-                    kwargs['compresslevel'] = level
-                return original_open(*args, **kwargs)
-
-            gzip.open = patched_open
-        elif algorithm == CompressionType.BZIP2:
-            # Monkey patch bz2 compression level
-            import bz2
-            original_open = bz2.open
-
-            def patched_open(*args, **kwargs):
-                if 'compresslevel' not in kwargs:
-                    kwargs['compresslevel'] = level
-                return original_open(*args, **kwargs)
-
-            bz2.open = patched_open
-        elif algorithm == CompressionType.XZ:
-            # Monkey patch lzma compression level
-            import lzma
-            original_open = lzma.open
-
-            def patched_open(*args, **kwargs):
-                if 'preset' not in kwargs:
-                    kwargs['preset'] = level
-                return original_open(*args, **kwargs)
-
-            lzma.open = patched_open
+        """
+        Run a single benchmark test
+
+        Args:
+            algorithm: Compression algorithm
+            level: Compression level
+            data_type: Data generator name
+            file_size: Size of each test file
+            file_count: Number of test files
+            slot_dir: Reusable scratch directory owned by this worker
+            io_mode: "memory" or "disk"
+            threads: Compression threads
+        """
+        # Same bytes for every algorithm, level and iteration of this shape
+        payloads = self._get_payloads(data_type, file_size, file_count)
+        total_size = sum(len(data) for data in payloads)
+
+        if io_mode == "disk":
+            # Files are truncated and rewritten in place, so one slot serves every
+            # test; the explicit file list keeps leftovers from larger tests out
+            file_paths = [slot_dir / f"file_{i}.dat" for i in range(len(payloads))]
+            for file_path, data in zip(file_paths, payloads):
+                with open(file_path, 'wb') as f:
+                    f.write(data)
 
         # Run compression
-        processor = AsyncTarProcessor(algorithm)
-        output_file = tmpdir / f"test.tar.{algorithm.value}"
+        processor = AsyncTarProcessor(algorithm, compression_level=level, threads=threads)
+
+        if io_mode == "disk":
+            output_file = slot_dir / "archive.out"
 
-        start_time = time.time()
-        success = await processor.compress_with_progress([test_dir], output_file)
-        end_time = time.time()
+            start_ns = time.perf_counter_ns()
+            success = await processor.compress_with_progress(file_paths, output_file)
+            elapsed_ns = time.perf_counter_ns() - start_ns
+
+            compressed_size = output_file.stat().st_size if success else 0
+        else:
+            members = [(f"file_{i}.dat", data) for i, data in enumerate(payloads)]
+            output = BytesIO()
+
+            start_ns = time.perf_counter_ns()
+            success = await processor.compress_bytes_with_progress(members, output)
+            elapsed_ns = time.perf_counter_ns() - start_ns
+
+            compressed_size = output.tell()
 
         if not success:
             raise RuntimeError("Compression failed")
 
         # Calculate results
-        compressed_size = output_file.stat().st_size
-        compression_time = end_time - start_time
+        compression_time = elapsed_ns / 1e9
         compression_ratio = (1 - compressed_size / total_size) * 100
         speed_mbps = (total_size / compression_time) / (1024 * 1024)
 
-        # Cleanup
-        output_file.unlink()
-        for f in test_dir.rglob("*"):
-            if f.is_file():
-                f.unlink()
-        test_dir.rmdir()
-
-        # Restore original functions
-        if algorithm == CompressionType.GZIP:
-            import gzip
-            gzip.open = original_open
-        elif algorithm == CompressionType.BZIP2:
-            import bz2
-            bz2.open = original_open
-        elif algorithm == CompressionType.XZ:
-            import lzma
-            lzma.open = original_open
-
         return BenchmarkResult(
             algorithm=algorithm.name,
             compression_level=level,
@@ -408,18 +564,29 @@ class CompressionBenchmark:
             compressed_size=compressed_size,
             compression_time=compression_time,
             compression_ratio=compression_ratio,
-            speed_mbps=speed_mbps
+            speed_mbps=speed_mbps,
+            threads=threads
         )
 
     async def run_benchmarks(self, config: BenchmarkConfig):
         """Run all benchmarks"""
-        total_tests = (
-                len(config.algorithms) *
-                sum(len(config.compression_levels.get(algo, [1])) for algo in config.algorithms) *
-                len(config.data_types) *
-                len(config.file_sizes) *
-                len(config.file_counts)
-        )
+        if config.seed is not None:
+            self.generator = DataGenerator(config.seed)
+            self._payload_cache.clear()
+            self._payload_cache_size = 0
+
+        # Data shape outermost, so cached payloads are reused by every
+        # algorithm and level before moving on to the next shape
+        jobs = [
+            BenchmarkJob(algorithm, level, data_type, size_bytes, file_count,
+                         config.iterations, config.io_mode, threads)
+            for data_type, (size_name, size_bytes), file_count, (algorithm, level) in itertools.product(
+                config.data_types, config.file_sizes, config.file_counts,
+                config.algorithms_with_levels()
+            )
+            for threads in config.threads_per_algo.get(algorithm, [1])
+        ]
+        total_tests = len(jobs)
 
         self.console.print(
             f"\n[cyan]Running {total_tests} benchmark tests with {config.iterations} iterations each...[/cyan]")
@@ -434,50 +601,91 @@ class CompressionBenchmark:
 
             task = progress.add_task("[green]Running benchmarks...", total=total_tests)
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmpdir_path = Path(tmpdir)
-
-                for algorithm in config.algorithms:
-                    levels = config.compression_levels.get(algorithm, [0])
-
-                    for level in levels:
-                        for data_type in config.data_types:
-                            for size_name, size_bytes in config.file_sizes:
-                                for file_count in config.file_counts:
-                                    # Run multiple iterations
-                                    iteration_results = []
-
-                                    for iteration in range(config.iterations):
-                                        try:
-                                            result = await self.run_single_benchmark(
-                                                algorithm, level, data_type,
-                                                size_bytes, file_count, tmpdir_path
-                                            )
-                                            iteration_results.append(result)
-                                        except Exception as e:
-                                            self.console.print(f"[red]Error in benchmark: {e}[/red]")
-                                            continue
-
-                                    # Average the results
-                                    if iteration_results:
-                                        avg_result = BenchmarkResult(
-                                            algorithm=iteration_results[0].algorithm,
-                                            compression_level=iteration_results[0].compression_level,
-                                            data_type=iteration_results[0].data_type,
-                                            file_size=iteration_results[0].file_size,
-                                            file_count=iteration_results[0].file_count,
-                                            original_size=iteration_results[0].original_size,
-                                            compressed_size=int(
-                                                statistics.mean(r.compressed_size for r in iteration_results)),
-                                            compression_time=statistics.mean(
-                                                r.compression_time for r in iteration_results),
-                                            compression_ratio=statistics.mean(
-                                                r.compression_ratio for r in iteration_results),
-                                            speed_mbps=statistics.mean(r.speed_mbps for r in iteration_results)
-                                        )
-                                        self.results.append(avg_result)
-
-                                    progress.update(task, advance=1)
+            if config.jobs > 1:
+                # Independent jobs run in worker processes, results arrive as they finish
+                loop = asyncio.get_running_loop()
+                with tempfile.TemporaryDirectory() as tmpdir, ProcessPoolExecutor(
+                        max_workers=config.jobs,
+                        initializer=_init_benchmark_worker,
+                        initargs=(tmpdir, config.seed)
+                ) as pool:
+                    futures = [loop.run_in_executor(pool, _run_benchmark_job, job) for job in jobs]
+                    for future in asyncio.as_completed(futures):
+                        try:
+                            result = await future
+                        except Exception as e:
+                            self.console.print(f"[red]Error in benchmark worker: {e}[/red]")
+                            result = None
+                        if result:
+                            self.results.append(result)
+                        progress.update(task, advance=1)
+            else:
+                with tempfile.TemporaryDirectory() as tmpdir:
+                    slot_dir = Path(tmpdir) / "slot_0"
+                    slot_dir.mkdir()
+                    for job in jobs:
+                        result = await self.run_job(job, slot_dir)
+                        if result:
+                            self.results.append(result)
+                        progress.update(task, advance=1)
+
+    async def run_job(self, job: BenchmarkJob, slot_dir: Path) -> Optional[BenchmarkResult]:
+        """Run all iterations of a job and return their average"""
+        iteration_results = []
+
+        if job.file_size * job.file_count < self.WARMUP_THRESHOLD:
+            # Short runs are dominated by cold caches and first-call setup
+            try:
+                await self.run_single_benchmark(
+                    job.algorithm, job.level, job.data_type,
+                    job.file_size, job.file_count, slot_dir, job.io_mode, job.threads
+                )
+            except Exception:
+                pass  # Reported by the measured iterations below
+
+        for iteration in range(job.iterations):
+            try:
+                result = await self.run_single_benchmark(
+                    job.algorithm, job.level, job.data_type,
+                    job.file_size, job.file_count, slot_dir, job.io_mode, job.threads
+                )
+                iteration_results.append(result)
+            except Exception as e:
+                self.console.print(f"[red]Error in benchmark: {e}[/red]")
+                continue
+
+        if not iteration_results:
+            return None
+
+        # Average the results in one pass, keeping the spread of the timings
+        n = len(iteration_results)
+        total_size = total_time = total_ratio = total_speed = total_time_sq = 0.0
+        for r in iteration_results:
+            total_size += r.compressed_size
+            total_time += r.compression_time
+            total_time_sq += r.compression_time * r.compression_time
+            total_ratio += r.compression_ratio
+            total_speed += r.speed_mbps
+
+        mean_time = total_time / n
+        # Sample variance; clamp the rounding noise of the sum-of-squares form
+        time_var = max(total_time_sq - n * mean_time * mean_time, 0.0) / (n - 1) if n > 1 else 0.0
+
+        first = iteration_results[0]
+        return BenchmarkResult(
+            algorithm=first.algorithm,
+            compression_level=first.compression_level,
+            data_type=first.data_type,
+            file_size=first.file_size,
+            file_count=first.file_count,
+            original_size=first.original_size,
+            compressed_size=int(total_size / n),
+            compression_time=mean_time,
+            compression_ratio=total_ratio / n,
+            speed_mbps=total_speed / n,
+            threads=job.threads,
+            time_stdev=math.sqrt(time_var)
+        )
 
     def display_results(self):
         """Display benchmark results"""
@@ -485,36 +693,37 @@ class CompressionBenchmark:
             self.console.print("[red]No results to display[/red]")
             return
 
-        # Group results by data type
-        data_types = sorted(set(r.data_type for r in self.results))
+        # One sort orders both the data type groups and the rows inside them
+        ordered = sorted(
+            self.results,
+            key=attrgetter('data_type', 'file_size', 'algorithm', 'compression_level', 'threads')
+        )
 
-        for data_type in data_types:
+        for data_type, type_results in itertools.groupby(ordered, key=attrgetter('data_type')):
             self.console.print(f"\n[bold cyan]Results for {data_type} data:[/bold cyan]")
 
             # Create table
             table = Table(show_header=True, header_style="bold magenta")
             table.add_column("Algorithm", style="cyan")
             table.add_column("Level", style="yellow")
+            table.add_column("Threads", style="yellow")
             table.add_column("File Size", style="green")
             table.add_column("File Count", style="blue")
             table.add_column("Compression %", style="red")
             table.add_column("Speed (MB/s)", style="magenta")
             table.add_column("Time (s)", style="white")
 
-            # Filter and sort results
-            type_results = [r for r in self.results if r.data_type == data_type]
-            type_results.sort(key=lambda r: (r.file_size, r.algorithm, r.compression_level))
-
             for r in type_results:
                 size_str = self._format_size(r.file_size)
                 table.add_row(
                     r.algorithm,
                     str(r.compression_level),
+                    str(r.threads),
                     size_str,
                     str(r.file_count),
                     f"{r.compression_ratio:.1f}%",
                     f"{r.speed_mbps:.1f}",
-                    f"{r.compression_time:.2f}"
+                    f"{r.compression_time:.2f} ± {r.time_stdev:.2f}"
                 )
 
             self.console.print(table)
@@ -524,13 +733,21 @@ class CompressionBenchmark:
         if not self.results:
             return
 
-        data = {
-            'timestamp': datetime.now().isoformat(),
-            'results': [asdict(r) for r in self.results]
-        }
-
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        # msgspec encodes dataclasses directly; stdlib json needs asdict first
+        if HAS_MSGSPEC:
+            encode = msgspec.json.encode
+        else:
+            def encode(obj) -> bytes:
+                return json.dumps(asdict(obj)).encode('utf-8')
+
+        # Stream one result per line instead of building the whole document
+        with open(filename, 'wb') as f:
+            f.write(b'{"timestamp": ' + json.dumps(datetime.now().isoformat()).encode('ascii'))
+            f.write(b', "results": [')
+            for i, r in enumerate(self.results):
+                f.write(b',\n  ' if i else b'\n  ')
+                f.write(encode(r))
+            f.write(b'\n]}\n')
 
         self.console.print(f"\n[green]Results saved to {filename}[/green]")
 
@@ -541,22 +758,26 @@ class CompressionBenchmark:
 
         self.console.print("\n[bold cyan]Benchmark Summary:[/bold cyan]")
 
-        # Best compression ratio by data type
+        # Best ratio and fastest per data type, collected in one grouped pass
+        best_lines = []
+        fastest_lines = []
+        ordered = sorted(self.results, key=attrgetter('data_type'))
+        for data_type, group in itertools.groupby(ordered, key=attrgetter('data_type')):
+            type_results = list(group)
+            best = max(type_results, key=attrgetter('compression_ratio'))
+            fastest = max(type_results, key=attrgetter('speed_mbps'))
+            best_lines.append(
+                f"  {data_type}: {self._describe(best)} ({best.compression_ratio:.1f}%)")
+            fastest_lines.append(
+                f"  {data_type}: {self._describe(fastest)} ({fastest.speed_mbps:.1f} MB/s)")
+
         self.console.print("\n[yellow]Best Compression Ratio by Data Type:[/yellow]")
-        data_types = sorted(set(r.data_type for r in self.results))
-        for data_type in data_types:
-            type_results = [r for r in self.results if r.data_type == data_type]
-            best = max(type_results, key=lambda r: r.compression_ratio)
-            self.console.print(
-                f"  {data_type}: {best.algorithm} level {best.compression_level} ({best.compression_ratio:.1f}%)")
+        for line in best_lines:
+            self.console.print(line)
 
-        # Fastest compression by data type
         self.console.print("\n[yellow]Fastest Compression by Data Type:[/yellow]")
-        for data_type in data_types:
-            type_results = [r for r in self.results if r.data_type == data_type]
-            fastest = max(type_results, key=lambda r: r.speed_mbps)
-            self.console.print(
-                f"  {data_type}: {fastest.algorithm} level {fastest.compression_level} ({fastest.speed_mbps:.1f} MB/s)")
+        for line in fastest_lines:
+            self.console.print(line)
 
         # Overall recommendations
         self.console.print("\n[yellow]Recommendations:[/yellow]")
@@ -566,22 +787,74 @@ class CompressionBenchmark:
                         'text' in r.data_type or 'json' in r.data_type or 'log' in r.data_type]
         if text_results:
             best_text = max(text_results, key=lambda r: r.compression_ratio / (r.compression_time + 0.1))
-            self.console.print(f"  For text data: {best_text.algorithm} level {best_text.compression_level}")
+            self.console.print(f"  For text data: {self._describe(best_text)}")
 
         # For binary data
         binary_results = [r for r in self.results if 'binary' in r.data_type]
         if binary_results:
-            best_binary = max(binary_results, key=lambda r: r.speed_mbps)
-            self.console.print(f"  For binary data: {best_binary.algorithm} level {best_binary.compression_level}")
+            best_binary = max(binary_results, key=attrgetter('speed_mbps'))
+            self.console.print(f"  For binary data: {self._describe(best_binary)}")
+
+        # Balanced: best throughput x space saved, ignoring results that save nothing
+        balanced_results = [r for r in self.results if r.compression_ratio > 0]
+        if balanced_results:
+            balanced = max(balanced_results, key=lambda r: r.speed_mbps * r.compression_ratio)
+            self.console.print(
+                f"  Balanced (speed x ratio): {self._describe(balanced)} "
+                f"({balanced.speed_mbps:.1f} MB/s, {balanced.compression_ratio:.1f}%)")
+
+    @classmethod
+    def _parse_size(cls, size_str: str) -> Optional[int]:
+        """
+        Parse a human readable size
+
+        Args:
+            size_str: Size such as "512", "64K", "64KB" or "5 MB" (case-insensitive)
+
+        Returns:
+            Size in bytes, or None if the input is not a valid size
+        """
+        match = cls.SIZE_PATTERN.fullmatch(size_str.strip().upper())
+        if not match:
+            return None
+        return int(match.group(1)) * cls.SIZE_UNITS[match.group(2)]
+
+    @staticmethod
+    def _describe(result: BenchmarkResult) -> str:
+        """Name the algorithm, level and, when parallel, the thread count of a result"""
+        text = f"{result.algorithm} level {result.compression_level}"
+        return f"{text} x{result.threads} threads" if result.threads > 1 else text
 
     @staticmethod
     def _format_size(size: int) -> str:
         """Format file size"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.0f}{unit}"
-            size /= 1024.0
-        return f"{size:.0f}TB"
+        # Each unit spans 10 bits, so the bit length picks it directly
+        units = ('B', 'KB', 'MB', 'GB', 'TB')
+        i = min((max(int(size), 1).bit_length() - 1) // 10, len(units) - 1)
+        return f"{size / (1 << (10 * i)):.0f}{units[i]}"
+
+
+# Per-process benchmark instance, keeps its payload cache across jobs
+_worker_benchmark: Optional[CompressionBenchmark] = None
+# Per-process scratch directory, created once under the parent's temp dir
+_worker_slot_dir: Optional[Path] = None
+
+
+def _init_benchmark_worker(tmpdir: str, seed: Optional[int] = None):
+    """Create the worker's benchmark instance and scratch slot"""
+    global _worker_benchmark, _worker_slot_dir
+    # Unseeded workers each draw their own OS seed, so their streams differ
+    _worker_benchmark = CompressionBenchmark(seed)
+    _worker_benchmark.console = Console(stderr=True)
+    _worker_slot_dir = Path(tmpdir) / f"slot_{os.getpid()}"
+    _worker_slot_dir.mkdir()
+
+
+def _run_benchmark_job(job: BenchmarkJob) -> Optional[BenchmarkResult]:
+    """Run one benchmark job inside a worker process"""
+    # Progress output of concurrent workers would interleave, keep it quiet
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        return asyncio.run(_worker_benchmark.run_job(job, _worker_slot_dir))
 
 
 async def main():
@@ -611,14 +884,17 @@ async def main():
     console.print(f"  File sizes: {', '.join(name for name, _ in config.file_sizes)}")
     console.print(f"  File counts: {', '.join(str(c) for c in config.file_counts)}")
     console.print(f"  Iterations: {config.iterations}")
+    console.print(f"  I/O mode: {config.io_mode}")
+    console.print(f"  Worker processes: {config.jobs}")
+    console.print(f"  Seed: {config.seed if config.seed is not None else 'random'}")
 
     if not Confirm.ask("\n[yellow]Start benchmark?[/yellow]", default=True):
         return
 
     # Run benchmarks
-    start_time = time.time()
+    start_time = time.perf_counter()
     await benchmark.run_benchmarks(config)
-    end_time = time.time()
+    end_time = time.perf_counter()
 
     console.print(f"\n[green]Benchmark completed in {end_time - start_time:.1f} seconds[/green]")
 
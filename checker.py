@@ -1,15 +1,15 @@
+import importlib.util
 import sys
 
 
 def check_module(name, description, required=True):
-    try:
-        __import__(name)
+    # 只定位模块而不执行导入，避免加载 C 扩展；_bz2/_lzma 单独检测
+    if importlib.util.find_spec(name) is not None:
         print(f"[✓] {name:<8} - {description} (可用)")
         return True
-    except ImportError:
-        status = "缺失" if required else "可选"
-        print(f"[{'✗' if required else '?'}] {name:<8} - {description} ({status})")
-        return False
+    status = "缺失" if required else "可选"
+    print(f"[{'✗' if required else '?'}] {name:<8} - {description} ({status})")
+    return False
 
 
 print(f"Python 版本: {sys.version}")
@@ -4,151 +4,203 @@ Async Tar Processor Usage Examples with Benchmark Integration
 """
 
 import asyncio
+import os
 import tarfile
 import tempfile
 import time
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
+from typing import List
 
 from tar_compressor import AsyncTarProcessor, CompressionType, CompressionChecker
 
 
-async def example_basic_usage():
-    """Basic usage example"""
-    print("=== Basic Usage Example ===")
-
-    # Create some test files
+@dataclass
+class Fixtures:
+    """Example inputs, created once and shared by every example in a run"""
+    root: Path
+    test_dir: Path  # Text files plus a subdirectory
+    memory_files: List[Path]
+    bytesio_dir: Path
+    standalone_files: List[Path]
+    source_dir: Path
+    small_text_file: Path
+    text_file: Path  # Highly compressible
+    random_file: Path  # Incompressible
+    mixed_dir: Path
+    many_files_dir: Path
+
+    def output_dir(self, name: str) -> Path:
+        """Directory for one example's outputs, kept apart from the inputs"""
+        path = self.root / "output" / name
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+
+@asynccontextmanager
+async def example_fixtures():
+    """Create the example inputs in a temporary directory, removed on exit"""
     with tempfile.TemporaryDirectory() as tmpdir:
-        test_dir = Path(tmpdir) / "test_data"
-        test_dir.mkdir()
+        root = Path(tmpdir)
+        inputs = root / "input"
+        inputs.mkdir()
 
-        # Create test files
+        test_dir = inputs / "test_data"
+        subdir = test_dir / "subdir"
+        subdir.mkdir(parents=True)
         for i in range(5):
-            file_path = test_dir / f"file_{i}.txt"
-            file_path.write_text(f"Test file {i}\n" * 1000)
+            (test_dir / f"file_{i}.txt").write_text(f"Test file {i}\n" * 1000)
+        for i in range(3):
+            (subdir / f"subfile_{i}.txt").write_text(f"Subdirectory file {i}\n" * 500)
 
-        # Create subdirectory
-        subdir = test_dir / "subdir"
-        subdir.mkdir()
+        memory_files = []
+        for i in range(3):
+            file_path = inputs / f"memory_test_{i}.txt"
+            file_path.write_text(f"In-memory test file {i}\n" * 1000)
+            memory_files.append(file_path)
+
+        bytesio_dir = inputs / "bytesio_test"
+        bytesio_dir.mkdir()
         for i in range(3):
-            file_path = subdir / f"subfile_{i}.txt"
-            file_path.write_text(f"Subdirectory file {i}\n" * 500)
+            (bytesio_dir / f"data_{i}.txt").write_text(f"BytesIO test data {i}\n" * 500)
+
+        standalone_files = []
+        for i in range(3):
+            file_path = inputs / f"standalone_{i}.txt"
+            file_path.write_text(f"Standalone file {i}\n" * 200)
+            standalone_files.append(file_path)
+
+        source_dir = inputs / "my_directory"
+        source_dir.mkdir()
+        for i in range(2):
+            (source_dir / f"dir_file_{i}.txt").write_text(f"Directory file {i}\n" * 300)
+
+        small_text_file = inputs / "test_data.txt"
+        small_text_file.write_text("Test data\n" * 1000)
+
+        text_file = inputs / "text_data.txt"
+        text_file.write_text("This is a repeated line of text data\n" * 50000)
 
-        # Use gzip compression
-        processor = AsyncTarProcessor(CompressionType.GZIP)
-        output_file = Path(tmpdir) / "test_archive.tar.gz"
+        random_file = inputs / "random_data.bin"
+        random_file.write_bytes(os.urandom(100000))
 
-        success = await processor.compress_with_progress(
-            [test_dir],
-            output_file
+        mixed_dir = inputs / "mixed_data"
+        mixed_dir.mkdir()
+        for i in range(10):
+            (mixed_dir / f"text_{i}.txt").write_text(f"File {i}\n" * 100)
+            (mixed_dir / f"data_{i}.bin").write_bytes(os.urandom(1000))
+
+        many_files_dir = inputs / "many_files"
+        many_files_dir.mkdir()
+        for i in range(100):
+            (many_files_dir / f"file_{i:03d}.txt").write_text(f"File content {i}\n" * 100)
+
+        yield Fixtures(
+            root=root,
+            test_dir=test_dir,
+            memory_files=memory_files,
+            bytesio_dir=bytesio_dir,
+            standalone_files=standalone_files,
+            source_dir=source_dir,
+            small_text_file=small_text_file,
+            text_file=text_file,
+            random_file=random_file,
+            mixed_dir=mixed_dir,
+            many_files_dir=many_files_dir
         )
 
-        if success:
-            print(f"\nCompressed file created: {output_file}")
-            print(f"File size: {output_file.stat().st_size} bytes")
 
+async def example_basic_usage(fixtures: Fixtures):
+    """Basic usage example"""
+    print("=== Basic Usage Example ===")
+
+    # Use gzip compression
+    processor = AsyncTarProcessor(CompressionType.GZIP)
+    output_file = fixtures.output_dir("basic") / "test_archive.tar.gz"
+
+    success = await processor.compress_with_progress(
+        [fixtures.test_dir],
+        output_file
+    )
 
-async def example_memory_operations():
+    if success:
+        print(f"\nCompressed file created: {output_file}")
+        print(f"File size: {output_file.stat().st_size} bytes")
+
+
+async def example_memory_operations(fixtures: Fixtures):
     """Example of in-memory compression using BytesIO"""
     print("\n=== In-Memory Compression Example ===")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create test data
-        test_files = []
-        for i in range(3):
-            file_path = Path(tmpdir) / f"memory_test_{i}.txt"
-            file_path.write_text(f"In-memory test file {i}\n" * 1000)
-            test_files.append(file_path)
-
-        # Compress to memory
-        processor = AsyncTarProcessor(CompressionType.GZIP)
-        print("Compressing to memory...")
+    # Compress to memory
+    processor = AsyncTarProcessor(CompressionType.GZIP)
+    print("Compressing to memory...")
 
-        memory_archive = await processor.compress_to_memory(test_files)
+    memory_archive = await processor.compress_to_memory(fixtures.memory_files)
 
-        if memory_archive:
-            print(f"Memory archive size: {memory_archive.tell()} bytes")
+    if memory_archive:
+        print(f"Memory archive size: {memory_archive.tell()} bytes")
 
-            # Verify the archive by reading it
-            memory_archive.seek(0)
-            with tarfile.open(fileobj=memory_archive, mode='r:gz') as tar:
-                print("Archive contents:")
-                for member in tar.getmembers():
-                    print(f"  - {member.name} ({member.size} bytes)")
+        # Verify the archive by reading it
+        memory_archive.seek(0)
+        with tarfile.open(fileobj=memory_archive, mode='r:gz') as tar:
+            print("Archive contents:")
+            for member in tar.getmembers():
+                print(f"  - {member.name} ({member.size} bytes)")
 
-            # Example: Save memory archive to file
-            output_path = Path(tmpdir) / "from_memory.tar.gz"
-            memory_archive.seek(0)
-            with open(output_path, 'wb') as f:
-                f.write(memory_archive.read())
-            print(f"Memory archive saved to: {output_path}")
+        # Example: Save memory archive to file
+        output_path = fixtures.output_dir("memory") / "from_memory.tar.gz"
+        memory_archive.seek(0)
+        with open(output_path, 'wb') as f:
+            f.write(memory_archive.read())
+        print(f"Memory archive saved to: {output_path}")
 
 
-async def example_direct_bytesio():
+async def example_direct_bytesio(fixtures: Fixtures):
     """Example of direct BytesIO usage"""
     print("\n=== Direct BytesIO Usage Example ===")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create test data
-        test_dir = Path(tmpdir) / "bytesio_test"
-        test_dir.mkdir()
+    # Create BytesIO buffer
+    output_buffer = BytesIO()
 
-        for i in range(3):
-            (test_dir / f"data_{i}.txt").write_text(f"BytesIO test data {i}\n" * 500)
+    # Compress directly to BytesIO
+    processor = AsyncTarProcessor(CompressionType.BZIP2)
+    success = await processor.compress_with_progress(
+        [fixtures.bytesio_dir],
+        output_buffer
+    )
 
-        # Create BytesIO buffer
-        output_buffer = BytesIO()
+    if success:
+        buffer_size = output_buffer.tell()
+        print(f"BytesIO buffer size: {buffer_size} bytes")
 
-        # Compress directly to BytesIO
-        processor = AsyncTarProcessor(CompressionType.BZIP2)
-        success = await processor.compress_with_progress(
-            [test_dir],
-            output_buffer
-        )
-
-        if success:
-            buffer_size = output_buffer.tell()
-            print(f"BytesIO buffer size: {buffer_size} bytes")
-
-            # Demonstrate reading from the buffer
-            output_buffer.seek(0)
-            first_bytes = output_buffer.read(20)
-            print(f"First 20 bytes: {first_bytes}")
+        # Demonstrate reading from the buffer
+        output_buffer.seek(0)
+        first_bytes = output_buffer.read(20)
+        print(f"First 20 bytes: {first_bytes}")
 
-            # Reset position
-            output_buffer.seek(0)
-            print("BytesIO buffer ready for use")
+        # Reset position
+        output_buffer.seek(0)
+        print("BytesIO buffer ready for use")
 
 
-async def example_multiple_sources():
+async def example_multiple_sources(fixtures: Fixtures):
     """Compress multiple source files/directories"""
     print("\n=== Multiple Sources Compression ===")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create multiple sources
-        sources = []
-
-        # Create several standalone files
-        for i in range(3):
-            file_path = Path(tmpdir) / f"standalone_{i}.txt"
-            file_path.write_text(f"Standalone file {i}\n" * 200)
-            sources.append(file_path)
-
-        # Create a directory
-        dir_path = Path(tmpdir) / "my_directory"
-        dir_path.mkdir()
-        for i in range(2):
-            (dir_path / f"dir_file_{i}.txt").write_text(f"Directory file {i}\n" * 300)
-        sources.append(dir_path)
+    # Several standalone files plus a directory
+    sources = [*fixtures.standalone_files, fixtures.source_dir]
 
-        # Use bzip2 compression
-        processor = AsyncTarProcessor(CompressionType.BZIP2)
-        output_file = Path(tmpdir) / "multi_source.tar.bz2"
+    # Use bzip2 compression
+    processor = AsyncTarProcessor(CompressionType.BZIP2)
+    output_file = fixtures.output_dir("multiple_sources") / "multi_source.tar.bz2"
 
-        await processor.compress_with_progress(sources, output_file)
+    await processor.compress_with_progress(sources, output_file)
 
 
-async def example_check_algorithms():
+async def example_check_algorithms(fixtures: Fixtures):
     """Check compression algorithm availability"""
     print("\n=== Check Compression Algorithm Support ===")
 
@@ -161,145 +213,114 @@ async def example_check_algorithms():
     # Test available compression algorithms
     print("\nTesting available compression algorithms...")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create test data
-        test_file = Path(tmpdir) / "test_data.txt"
-        test_file.write_text("Test data\n" * 1000)
-
-        # Get algorithm info
-        algo_info = CompressionChecker.check_availability()
-
-        for comp_type, info in algo_info.items():
-            if comp_type == CompressionType.NONE:
-                continue
-
-            if info.available:
-                print(f"\nTesting {info.name}...")
-                try:
-                    processor = AsyncTarProcessor(comp_type)
-                    output_file = Path(tmpdir) / f"test{info.extension}"
-
-                    success = await processor.compress_with_progress(
-                        [test_file],
-                        output_file,
-                    )
-
-                    if success and output_file.exists():
-                        size = output_file.stat().st_size
-                        print(f"  ✓ Success: {size:,} bytes")
-                except Exception as e:
-                    print(f"  ✗ Failed: {e}")
-            else:
-                print(f"\nSkipping {info.name} (not installed)")
-
-
-async def example_different_compressions():
-    """Test performance comparison of different compression algorithms"""
-    print("\n=== Compression Algorithm Performance Comparison ===")
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create different types of test data
-        print("Creating test data...")
+    output_dir = fixtures.output_dir("check_algorithms")
 
-        # Text data (high compression ratio)
-        text_file = Path(tmpdir) / "text_data.txt"
-        text_file.write_text("This is a repeated line of text data\n" * 50000)
+    # Get algorithm info
+    algo_info = CompressionChecker.check_availability()
 
-        # Random data (low compression ratio)
-        import random
-        random_file = Path(tmpdir) / "random_data.bin"
-        random_data = bytes(random.randint(0, 255) for _ in range(100000))
-        random_file.write_bytes(random_data)
-
-        # Mixed data
-        mixed_dir = Path(tmpdir) / "mixed_data"
-        mixed_dir.mkdir()
-        for i in range(10):
-            (mixed_dir / f"text_{i}.txt").write_text(f"File {i}\n" * 100)
-            (mixed_dir / f"data_{i}.bin").write_bytes(
-                bytes(random.randint(0, 255) for _ in range(1000))
-            )
-
-        # Test different algorithms
-        results = []
-        algo_info = CompressionChecker.check_availability()
-
-        for comp_type in [CompressionType.GZIP, CompressionType.BZIP2,
-                          CompressionType.XZ, CompressionType.LZ4]:
-            if not algo_info[comp_type].available:
-                print(f"\nSkipping {comp_type.name} (not installed)")
-                continue
-
-            print(f"\nTesting {comp_type.name} compression...")
+    for comp_type, info in algo_info.items():
+        if comp_type == CompressionType.NONE:
+            continue
 
+        if info.available:
+            print(f"\nTesting {info.name}...")
             try:
                 processor = AsyncTarProcessor(comp_type)
-                output_file = Path(tmpdir) / f"test.tar{algo_info[comp_type].extension}"
+                output_file = output_dir / f"test{info.extension}"
 
-                start_time = time.time()
                 success = await processor.compress_with_progress(
-                    [text_file, random_file, mixed_dir],
-                    output_file
+                    [fixtures.small_text_file],
+                    output_file,
                 )
-                end_time = time.time()
 
-                if success:
+                if success and output_file.exists():
                     size = output_file.stat().st_size
-                    duration = end_time - start_time
-                    results.append({
-                        'name': comp_type.name,
-                        'size': size,
-                        'time': duration,
-                        'desc': algo_info[comp_type].description
-                    })
+                    print(f"  ✓ Success: {size:,} bytes")
             except Exception as e:
-                print(f"  Error: {e}")
+                print(f"  ✗ Failed: {e}")
+        else:
+            print(f"\nSkipping {info.name} (not installed)")
 
-        # Display comparison results
-        if results:
-            print("\n\nCompression Algorithm Performance Comparison:")
-            print("=" * 70)
-            print(f"{'Algorithm':<10} {'Compressed Size':<15} {'Time':<10} {'Speed':<15} {'Description'}")
-            print("-" * 70)
 
-            # Calculate original size
-            original_size = sum(p.stat().st_size for p in [text_file, random_file]
-                                if p.exists())
-            original_size += sum(f.stat().st_size for f in mixed_dir.rglob("*")
-                                 if f.is_file())
+async def example_different_compressions(fixtures: Fixtures):
+    """Test performance comparison of different compression algorithms"""
+    print("\n=== Compression Algorithm Performance Comparison ===")
+
+    # Text data (high compression ratio), random data (low compression ratio)
+    # and a mixed directory, all created up front by example_fixtures
+    text_file, random_file, mixed_dir = fixtures.text_file, fixtures.random_file, fixtures.mixed_dir
+    output_dir = fixtures.output_dir("different_compressions")
 
-            for r in results:
-                compression_ratio = (1 - r['size'] / original_size) * 100
-                speed = original_size / r['time'] / 1024 / 1024  # MB/s
+    # Test different algorithms
+    results = []
+    algo_info = CompressionChecker.check_availability()
 
-                print(f"{r['name']:<10} {r['size']:>12,} B  {r['time']:>6.2f}s  "
-                      f"{speed:>6.1f} MB/s  {r['desc']}")
+    for comp_type in [CompressionType.GZIP, CompressionType.BZIP2,
+                      CompressionType.XZ, CompressionType.LZ4]:
+        if not algo_info[comp_type].available:
+            print(f"\nSkipping {comp_type.name} (not installed)")
+            continue
 
-            print("-" * 70)
-            print(f"Original size: {original_size:,} bytes")
+        print(f"\nTesting {comp_type.name} compression...")
 
+        try:
+            processor = AsyncTarProcessor(comp_type)
+            output_file = output_dir / f"test.tar{algo_info[comp_type].extension}"
 
-async def example_interrupt_handling():
+            start_time = time.time()
+            success = await processor.compress_with_progress(
+                [text_file, random_file, mixed_dir],
+                output_file
+            )
+            end_time = time.time()
+
+            if success:
+                size = output_file.stat().st_size
+                duration = end_time - start_time
+                results.append({
+                    'name': comp_type.name,
+                    'size': size,
+                    'time': duration,
+                    'desc': algo_info[comp_type].description
+                })
+        except Exception as e:
+            print(f"  Error: {e}")
+
+    # Display comparison results
+    if results:
+        print("\n\nCompression Algorithm Performance Comparison:")
+        print("=" * 70)
+        print(f"{'Algorithm':<10} {'Compressed Size':<15} {'Time':<10} {'Speed':<15} {'Description'}")
+        print("-" * 70)
+
+        # Calculate original size
+        original_size = sum(p.stat().st_size for p in [text_file, random_file]
+                            if p.exists())
+        original_size += sum(f.stat().st_size for f in mixed_dir.rglob("*")
+                             if f.is_file())
+
+        for r in results:
+            compression_ratio = (1 - r['size'] / original_size) * 100
+            speed = original_size / r['time'] / 1024 / 1024  # MB/s
+
+            print(f"{r['name']:<10} {r['size']:>12,} B  {r['time']:>6.2f}s  "
+                  f"{speed:>6.1f} MB/s  {r['desc']}")
+
+        print("-" * 70)
+        print(f"Original size: {original_size:,} bytes")
+
+
+async def example_interrupt_handling(fixtures: Fixtures):
     """Demonstrate interrupt handling"""
     print("\n=== Interrupt Handling Demo ===")
     print("Tip: Press Ctrl+C during compression to test interrupt handling")
     print("First time will ask for confirmation, second time will force interrupt\n")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create many files to extend compression time
-        test_dir = Path(tmpdir) / "many_files"
-        test_dir.mkdir()
-
-        print("Creating test files...")
-        for i in range(100):
-            file_path = test_dir / f"file_{i:03d}.txt"
-            file_path.write_text(f"File content {i}\n" * 100)
-
-        processor = AsyncTarProcessor(CompressionType.GZIP)
-        output_file = Path(tmpdir) / "interruptible.tar.gz"
+    processor = AsyncTarProcessor(CompressionType.GZIP)
+    output_file = fixtures.output_dir("interrupt") / "interruptible.tar.gz"
 
-        print("\nStarting compression, you can try pressing Ctrl+C now...")
-        await processor.compress_with_progress([test_dir], output_file)
+    print("\nStarting compression, you can try pressing Ctrl+C now...")
+    await processor.compress_with_progress([fixtures.many_files_dir], output_file)
 
 
 async def example_command_line_vs_interactive():
@@ -315,8 +336,9 @@ async def example_command_line_vs_interactive():
     print("  python tar_compressor.py -i")
     print("  python tar_compressor.py  # Without arguments")
     print()
-    print("The compression algorithm is determined by the -t parameter,")
-    print("NOT by the output filename extension!")
+    print("Without -t, the compression algorithm follows the output extension")
+    print("(.tar.gz, .gz, .bz2, .xz, .lz4, .zst, .tar); other names get zstd,")
+    print("or gzip when zstandard is not installed. -t always wins.")
 
 
 async def run_comprehensive_benchmark():
@@ -337,35 +359,43 @@ async def run_comprehensive_benchmark():
 
 async def main():
     """Run all examples"""
+    # (name, function, whether it takes the shared Fixtures)
     examples = [
-        ("Basic Usage", example_basic_usage),
-        ("In-Memory Compression", example_memory_operations),
-        ("Direct BytesIO Usage", example_direct_bytesio),
-        ("Multiple Sources Compression", example_multiple_sources),
-        ("Check Algorithm Support", example_check_algorithms),
-        ("Compression Algorithm Performance Comparison", example_different_compressions),
-        ("Interrupt Handling", example_interrupt_handling),
-        ("Command Line vs Interactive", example_command_line_vs_interactive),
-        ("Comprehensive Benchmark Suite", run_comprehensive_benchmark)
+        ("Basic Usage", example_basic_usage, True),
+        ("In-Memory Compression", example_memory_operations, True),
+        ("Direct BytesIO Usage", example_direct_bytesio, True),
+        ("Multiple Sources Compression", example_multiple_sources, True),
+        ("Check Algorithm Support", example_check_algorithms, True),
+        ("Compression Algorithm Performance Comparison", example_different_compressions, True),
+        ("Interrupt Handling", example_interrupt_handling, True),
+        ("Command Line vs Interactive", example_command_line_vs_interactive, False),
+        ("Comprehensive Benchmark Suite", run_comprehensive_benchmark, False)
     ]
 
     print("Async Tar Processor Demo Program")
     print("=" * 40)
 
-    for i, (name, func) in enumerate(examples, 1):
+    for i, (name, func, _) in enumerate(examples, 1):
         print(f"\n{i}. {name}")
 
     choice = input("\nSelect example to run (1-9) or 'a' to run all: ").strip()
 
     if choice.lower() == 'a':
-        for name, func in examples[:-1]:  # Skip benchmark in "run all" mode
-            await func()
-            if func != examples[-2][1]:  # Don't wait after last regular example
-                input("\nPress Enter to continue to next example...")
+        selected = examples[:-1]  # Skip benchmark in "run all" mode
     elif choice.isdigit() and 1 <= int(choice) <= len(examples):
-        await examples[int(choice) - 1][1]()
+        selected = examples[int(choice) - 1:int(choice)]
     else:
         print("Invalid choice")
+        return
+
+    # Inputs are created once, only if a selected example uses them, and
+    # reused by every one that does
+    needs_fixtures = any(needs for _, _, needs in selected)
+    async with example_fixtures() if needs_fixtures else nullcontext() as fixtures:
+        for name, func, needs in selected:
+            await (func(fixtures) if needs else func())
+            if len(selected) > 1 and func != selected[-1][1]:  # Don't wait after last example
+                input("\nPress Enter to continue to next example...")
 
 
 if __name__ == "__main__":
@@ -1,22 +1,60 @@
 #!/usr/bin/env python3
 """
 Async Tar Compressor/Decompressor - Support progress bar display and intelligent interrupt handling
-Supported compression algorithms: gzip, bzip2, xz/lzma, lz4
+Supported compression algorithms: gzip, bzip2, xz/lzma, lz4, zstd
 Support both file and in-memory (BytesIO, bytes, str) operations
 """
 
 import asyncio
+import functools
+import importlib.util
 import os
+import queue
+import shutil
 import signal
+import stat
+import struct
+import subprocess
 import sys
 import tarfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
-from io import BytesIO
+from io import BytesIO, BufferedReader, BufferedWriter, FileIO
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional, List, Union, Dict, BinaryIO, Tuple
 
+
+def _lazy_import(name: str):
+    """
+    Register a module that is only executed on first attribute access
+
+    The optional compression backends are only needed once their format is
+    used, but importing them eagerly added to every command line start,
+    including --help. Modules that are not installed still raise ImportError
+    here, so the HAS_* flags below keep their meaning. Bind the returned
+    module directly: an import statement would touch __spec__ and load it.
+    """
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    parent, _, child = name.rpartition('.')
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
 # Try to import standard library compression modules
 # Even standard library modules might not be available in custom Python builds
 
@@ -44,12 +82,81 @@ except ImportError:
 
 # Optional third-party compression libraries
 try:
-    import lz4.frame
+    import lz4
+    _lazy_import("lz4.frame")  # Sets lz4.frame
 
     HAS_LZ4 = True
 except ImportError:
     HAS_LZ4 = False
 
+try:
+    zstandard = _lazy_import("zstandard")
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# Optional accelerated gzip backend (ISA-L), output stays standard gzip
+try:
+    from isal import isal_zlib
+    igzip = _lazy_import("isal.igzip")
+
+    HAS_ISAL = True
+except ImportError:
+    HAS_ISAL = False
+
+# Threaded ISA-L writer (python-isal 1.3+), output is a single gzip stream
+try:
+    igzip_threaded = _lazy_import("isal.igzip_threaded")
+
+    HAS_ISAL_THREADED = True
+except ImportError:
+    HAS_ISAL_THREADED = False
+
+# Optional multi-threaded gzip backend, writes concatenated gzip members
+try:
+    mgzip = _lazy_import("mgzip")
+
+    HAS_MGZIP = True
+except ImportError:
+    HAS_MGZIP = False
+
+# Optional parallel bzip2 decoder with seek support
+try:
+    import indexed_bzip2
+
+    HAS_INDEXED_BZIP2 = True
+except ImportError:
+    HAS_INDEXED_BZIP2 = False
+
+# Optional SIMD base64 codec for compress_to_str/decompress_from_str
+try:
+    pybase64 = _lazy_import("pybase64")
+
+    HAS_PYBASE64 = True
+except ImportError:
+    HAS_PYBASE64 = False
+
+# Optional libuv event loop for the command line entry point (uvloop.run needs 0.18+)
+try:
+    import uvloop
+
+    HAS_UVLOOP = hasattr(uvloop, "run")
+except ImportError:
+    HAS_UVLOOP = False
+
+# Readahead hints for large sequential reads, POSIX only
+HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
+# Owner name lookups for tar headers, not available on Windows
+try:
+    import grp
+    import pwd
+
+    HAS_PWD = True
+except ImportError:
+    HAS_PWD = False
+
 from rich.progress import (
     Progress,
     SpinnerColumn,
@@ -65,6 +172,21 @@ from rich.prompt import Confirm, Prompt
 from rich.panel import Panel
 from rich.table import Table
 
+# Progress columns shared by every display. TimeRemainingColumn is left out:
+# it caches renders per task id, so each display gets its own instance
+PROGRESS_COLUMNS = (
+    SpinnerColumn(),
+    TextColumn("[progress.description]{task.description}"),
+    BarColumn(),
+    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+    MofNCompleteColumn(),
+    DownloadColumn(),
+    TimeElapsedColumn(),
+)
+
+# Shared console, each Console() probes the terminal when it is created
+CONSOLE = Console()
+
 
 class CompressionType(Enum):
     """Supported compression types"""
@@ -72,6 +194,7 @@ class CompressionType(Enum):
     BZIP2 = "bz2"
     XZ = "xz"
     LZ4 = "lz4"
+    ZSTD = "zst"
     NONE = ""
 
 
@@ -107,22 +230,29 @@ class CompressionChecker:
             "lzma": HAS_LZMA,
             "_lzma": HAS_LZMA,  # C extension
             "lz4": HAS_LZ4,
-            "lz4.frame": HAS_LZ4
+            "lz4.frame": HAS_LZ4,
+            "zstandard": HAS_ZSTD
         }
 
         if module_name in module_map:
             return module_map[module_name]
 
-        # For other modules, try importing
+        # For other modules, look the module up without importing it
         try:
-            __import__(module_name)
-            return True
-        except ImportError:
+            return importlib.util.find_spec(module_name) is not None
+        except (ImportError, ValueError):
             return False
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def check_availability() -> Dict[CompressionType, CompressionInfo]:
-        """Check availability of all compression algorithms"""
+        """
+        Check availability of all compression algorithms
+
+        Availability is fixed once the module has been imported, so the
+        table is built on the first call and shared afterwards; callers
+        must not modify it.
+        """
         info = {
             CompressionType.GZIP: CompressionInfo(
                 name="GZIP",
@@ -156,6 +286,14 @@ class CompressionChecker:
                 install_cmd="pip install lz4",
                 description="Extremely fast compression, lower compression ratio"
             ),
+            CompressionType.ZSTD: CompressionInfo(
+                name="ZSTD",
+                module="zstandard",
+                extension=".zst",
+                available=HAS_ZSTD,
+                install_cmd="pip install zstandard",
+                description="Fast compression with high ratio, wide level range"
+            ),
             CompressionType.NONE: CompressionInfo(
                 name="No compression",
                 module="",
@@ -267,7 +405,14 @@ class CompressionChecker:
             "bz2": ("BZIP2 support", HAS_BZ2),
             "lzma": ("LZMA/XZ support", HAS_LZMA),
             "lz4": ("LZ4 support (optional)", HAS_LZ4),
+            "zstandard": ("Zstandard support (optional)", HAS_ZSTD),
+            "isal": ("ISA-L accelerated gzip (optional)", HAS_ISAL),
+            "mgzip": ("Multi-threaded gzip (optional)", HAS_MGZIP),
+            "indexed_bzip2": ("Parallel bzip2 decoding (optional)", HAS_INDEXED_BZIP2),
+            "uvloop": ("libuv event loop (optional)", HAS_UVLOOP),
+            "pybase64": ("SIMD base64 codec (optional)", HAS_PYBASE64),
         }
+        optional_modules = {"lz4", "zstandard", "isal", "mgzip", "indexed_bzip2", "uvloop", "pybase64"}
 
         all_good = True
         missing_core = []
@@ -276,7 +421,7 @@ class CompressionChecker:
             if available:
                 console.print(f"  [green]✓[/green] {module:<8} - {description}")
             else:
-                if module != "lz4":  # LZ4 is optional
+                if module not in optional_modules:
                     missing_core.append(module)
                     all_good = False
                 console.print(f"  [red]✗[/red] {module:<8} - {description} [red](MISSING)[/red]")
@@ -393,6 +538,7 @@ class CompressionChecker:
             "bzip2": HAS_BZ2,
             "xz": HAS_LZMA,
             "lz4": HAS_LZ4,
+            "zstd": HAS_ZSTD,
             "none": True
         }
 
@@ -406,8 +552,8 @@ class OperationStats:
     total_size: int = 0
     processed_size: int = 0
     result_size: int = 0
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
+    start_time: Optional[int] = None  # time.perf_counter_ns()
+    end_time: Optional[int] = None  # time.perf_counter_ns()
 
 
 class InterruptHandler:
@@ -438,30 +584,138 @@ class InterruptHandler:
             self.interrupted = True
         else:
             # Second interrupt, force exit
-            console = Console()
-            console.print("\n[red]Force interrupt![/red]")
+            CONSOLE.print("\n[red]Force interrupt![/red]")
             self.cleanup()
             sys.exit(1)
 
 
+class ParallelLZ4Writer:
+    """
+    Write-only file object compressing LZ4 frames on a thread pool
+
+    Input is cut into fixed-size blocks, each compressed as an independent
+    frame; concatenated frames are a valid LZ4 stream that any LZ4 reader
+    (including lz4.frame.open) decodes as one file. Frames are written in
+    order, with at most two blocks per thread in flight. Blocks are filled
+    in place in a ring of preallocated buffers, one per frame in flight
+    plus the one being filled, so steady-state writes allocate nothing.
+    """
+
+    # write() runs for every tar block, slots keep its attribute reads cheap
+    __slots__ = (
+        '_fileobj', '_block_size', '_level', '_pool', '_max_pending', '_pending',
+        '_blocks', '_slot', '_filled'
+    )
+
+    def __init__(self, fileobj: BinaryIO, block_size: int, threads: int, compression_level: int = 0):
+        """
+        Args:
+            fileobj: Destination, left open on close
+            block_size: Uncompressed bytes per frame
+            threads: Compression threads
+            compression_level: LZ4 compression level
+        """
+        self._fileobj = fileobj
+        self._block_size = block_size
+        self._level = compression_level
+        self._pool = ThreadPoolExecutor(max_workers=threads)
+        self._max_pending = threads * 2
+        self._pending = deque()
+        # A slot is refilled only after the frame compressed from it was
+        # written, which _submit guarantees by bounding the pending queue
+        self._blocks = [memoryview(bytearray(block_size)) for _ in range(self._max_pending + 1)]
+        self._slot = 0
+        self._filled = 0
+
+    def _compress(self, block: memoryview) -> bytes:
+        # lz4 releases the GIL while compressing a frame
+        return lz4.frame.compress(block, compression_level=self._level)
+
+    def _submit(self, length: int):
+        block = self._blocks[self._slot][:length]
+        self._pending.append(self._pool.submit(self._compress, block))
+        self._slot = (self._slot + 1) % len(self._blocks)
+        self._filled = 0
+        if len(self._pending) > self._max_pending:
+            self._fileobj.write(self._pending.popleft().result())
+
+    def write(self, data) -> int:
+        """Copy data into the current block, handing every full block to the pool"""
+        view = memoryview(data).cast('B')
+        size = self._block_size
+        while view:
+            n = min(size - self._filled, len(view))
+            self._blocks[self._slot][self._filled:self._filled + n] = view[:n]
+            self._filled += n
+            view = view[n:]
+            if self._filled == size:
+                self._submit(size)
+        return len(data)
+
+    def flush(self):
+        """Frames are only complete once close() runs, nothing to do here"""
+
+    def close(self):
+        """Compress the last partial block and write every pending frame"""
+        if self._filled:
+            self._submit(self._filled)
+        while self._pending:
+            self._fileobj.write(self._pending.popleft().result())
+        self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Abandon the output, do not wait for frames nobody will write
+            self._pending.clear()
+            self._pool.shutdown(cancel_futures=True)
+
+
 class AsyncTarProcessor:
     """Async Tar Compressor/Decompressor"""
 
-    def __init__(self, compression: CompressionType = CompressionType.GZIP):
+    def __init__(
+            self,
+            compression: CompressionType = CompressionType.GZIP,
+            compression_level: Optional[int] = None,
+            threads: Optional[int] = None,
+            reproducible: bool = False,
+            console: Optional[Console] = None
+    ):
         """
         Initialize async tar processor
 
         Args:
             compression: Compression type to use
+            compression_level: Compression level, None = library default
+                (gzip/bzip2 1-9, xz preset 0-9, lz4 0-16, zstd 1-22)
+            threads: Compression threads, None = one less than the CPU count
+            reproducible: Write byte-identical archives for identical inputs:
+                zero mtime/uid/gid, empty owner names, sorted directory walks
+                and no timestamp or file name in gzip headers
+            console: Console for progress and messages, None = shared CONSOLE
         """
         self.compression = compression
-        self.console = Console()
+        self.console = console or CONSOLE
         self.interrupt_handler = InterruptHandler()
         self._cancelled = False
         self.stats: Optional[OperationStats] = None
-        self.compression_level: int = 9  # Maximum compression by default
+        self.compression_level: Optional[int] = compression_level
+        self.threads: int = threads if threads is not None else max((os.cpu_count() or 1) - 1, 1)
+        self.reproducible = reproducible
         # Add base_path attribute for relative path support
         self._base_paths: Dict[Path, Path] = {}  # Maps source paths to their base paths
+        self._source_stats: Dict[Path, Optional[os.stat_result]] = {}  # Stat of each source, None if missing
+        self._source_entries: Dict[Path, List[os.DirEntry]] = {}  # Files found under each directory source
+        self._last_yield = 0.0  # time.monotonic() of the last throttled event loop yield
+        self._pending_advance = 0  # Overall progress not yet published to the display
+        self._incompressible_size = 0  # Bytes of already-compressed files found by the last scan
+        self._opened_output: Optional[Path] = None  # Archive file truncated by the current compression
+        self._last_advance = 0.0  # time.monotonic() of the last overall progress update
 
     @classmethod
     def get_supported_algorithms(cls) -> List[CompressionType]:
@@ -473,6 +727,13 @@ class AsyncTarProcessor:
         """Check if a specific algorithm is supported on this system"""
         return CompressionChecker.is_algorithm_available(algorithm)
 
+    @classmethod
+    def supports_threads(cls, algorithm: CompressionType) -> bool:
+        """Check if an algorithm compresses faster with more threads here"""
+        if algorithm == CompressionType.GZIP:
+            return HAS_ISAL_THREADED or HAS_MGZIP
+        return algorithm in (CompressionType.ZSTD, CompressionType.LZ4)
+
     @classmethod
     def get_algorithm_info(cls, algorithm: CompressionType) -> Optional[CompressionInfo]:
         """Get information about a specific algorithm"""
@@ -482,10 +743,7 @@ class AsyncTarProcessor:
     @classmethod
     def print_support_summary(cls, console: Optional[Console] = None):
         """Print a summary of compression support"""
-        if console is None:
-            console = Console()
-
-        CompressionChecker.print_availability_table(console)
+        CompressionChecker.print_availability_table(console or CONSOLE)
 
     def _check_compression_availability(self):
         """Check if selected compression algorithm is available"""
@@ -526,113 +784,597 @@ class AsyncTarProcessor:
 
             raise RuntimeError(f"{info.name} compression algorithm not available on this Python installation")
 
+    # Archive name suffixes per compression type, checked with str.endswith
+    ARCHIVE_SUFFIXES = {
+        CompressionType.GZIP: ('.gz', '.tgz'),
+        CompressionType.BZIP2: ('.bz2', '.tbz', '.tbz2'),
+        CompressionType.XZ: ('.xz', '.txz'),
+        CompressionType.LZ4: ('.lz4', '.tlz4'),
+        CompressionType.ZSTD: ('.zst', '.zstd', '.tzst'),
+        CompressionType.NONE: ('.tar',),
+    }
+
+    # Magic numbers at the start of each compressed stream
+    MAGIC_NUMBERS = {
+        CompressionType.GZIP: b'\x1f\x8b',
+        CompressionType.BZIP2: b'BZh',
+        CompressionType.XZ: b'\xfd7zXZ\x00',
+        CompressionType.LZ4: b'\x04"M\x18',
+        CompressionType.ZSTD: b'\x28\xb5\x2f\xfd',
+    }
+
+    # Module flag and error message for algorithms that depend on optional modules
+    MODULE_REQUIREMENTS = {
+        CompressionType.GZIP: (
+            HAS_GZIP, "GZIP compression not available. Install zlib development libraries and rebuild Python."),
+        CompressionType.BZIP2: (
+            HAS_BZ2, "BZIP2 compression not available. Install bz2 development libraries and rebuild Python."),
+        CompressionType.XZ: (
+            HAS_LZMA, "XZ/LZMA compression not available. Install lzma development libraries and rebuild Python."),
+        CompressionType.LZ4: (HAS_LZ4, "LZ4 compression not available. Install with: pip install lz4"),
+        CompressionType.ZSTD: (HAS_ZSTD, "ZSTD compression not available. Install with: pip install zstandard"),
+    }
+
+    # tarfile mode suffixes; LZ4/ZSTD use the plain mode and handle the frame format separately
+    TARFILE_MODE_SUFFIXES = {
+        CompressionType.GZIP: ":gz",
+        CompressionType.BZIP2: ":bz2",
+        CompressionType.XZ: ":xz",
+        CompressionType.LZ4: "",
+        CompressionType.ZSTD: "",
+        CompressionType.NONE: ""
+    }
+
+    @classmethod
+    def compression_for_output(cls, output_file: Union[str, Path]) -> CompressionType:
+        """
+        Pick the compression for a new archive from its file name
+
+        Args:
+            output_file: Archive path, e.g. backup.tar.xz
+
+        Returns:
+            The type matching the extension; for unknown extensions zstd,
+            the best speed/ratio trade-off, or gzip when zstandard is missing
+        """
+        compression = cls.compression_for_suffix(output_file)
+        if compression is not None:
+            return compression
+        return CompressionType.ZSTD if HAS_ZSTD else CompressionType.GZIP
+
+    @classmethod
+    def compression_for_suffix(cls, file_name: Union[str, Path]) -> Optional[CompressionType]:
+        """
+        Map an archive extension to its compression type
+
+        Args:
+            file_name: Archive path, e.g. backup.tar.xz or data.zst
+
+        Returns:
+            The matching type, None if the name has no known archive extension
+        """
+        # Bare .gz/.xz/... count too, the tar inside is still compressed that way
+        name_lower = Path(file_name).name.lower()
+        for compression, suffixes in cls.ARCHIVE_SUFFIXES.items():
+            if name_lower.endswith(suffixes):
+                return compression
+        return None
+
     def _detect_compression_type(self, file_path: Union[str, Path]) -> CompressionType:
         """Detect compression type from file extension"""
-        if isinstance(file_path, str):
-            file_path = Path(file_path)
-
-        name_lower = file_path.name.lower()
-
-        if name_lower.endswith('.tar.gz') or name_lower.endswith('.tgz'):
-            return CompressionType.GZIP
-        elif name_lower.endswith('.tar.bz2') or name_lower.endswith('.tbz') or name_lower.endswith('.tbz2'):
-            return CompressionType.BZIP2
-        elif name_lower.endswith('.tar.xz') or name_lower.endswith('.txz'):
-            return CompressionType.XZ
-        elif name_lower.endswith('.tar.lz4') or name_lower.endswith('.tlz4'):
-            return CompressionType.LZ4
-        elif name_lower.endswith('.tar'):
-            return CompressionType.NONE
-        else:
-            # Try to detect by reading file header
-            return self._detect_compression_from_content(file_path)
+        compression = self.compression_for_suffix(file_path)
+        if compression is not None:
+            return compression
+
+        # Try to detect by reading file header
+        return self._detect_compression_from_content(Path(file_path))
 
     def _detect_compression_from_content(self, file_path: Path) -> CompressionType:
         """Detect compression type from file content"""
         try:
             with open(file_path, 'rb') as f:
                 header = f.read(16)
-
-            # Check magic numbers
-            if header.startswith(b'\x1f\x8b'):  # gzip
-                return CompressionType.GZIP
-            elif header.startswith(b'BZh'):  # bzip2
-                return CompressionType.BZIP2
-            elif header.startswith(b'\xfd7zXZ\x00'):  # xz
-                return CompressionType.XZ
-            elif header.startswith(b'\x04"M\x18'):  # lz4
-                return CompressionType.LZ4
-            else:
-                # Assume uncompressed tar
-                return CompressionType.NONE
         except:
             return CompressionType.NONE
 
+        return self._match_magic_number(header)
+
     def _detect_compression_from_bytes(self, data: bytes) -> CompressionType:
         """Detect compression type from bytes content"""
         if len(data) < 16:
             return CompressionType.NONE
 
-        # Check magic numbers
-        if data.startswith(b'\x1f\x8b'):  # gzip
-            return CompressionType.GZIP
-        elif data.startswith(b'BZh'):  # bzip2
-            return CompressionType.BZIP2
-        elif data.startswith(b'\xfd7zXZ\x00'):  # xz
-            return CompressionType.XZ
-        elif data.startswith(b'\x04"M\x18'):  # lz4
-            return CompressionType.LZ4
-        else:
-            return CompressionType.NONE
+        return self._match_magic_number(data)
+
+    @classmethod
+    def _match_magic_number(cls, header: bytes) -> CompressionType:
+        """Map the leading bytes of a stream to its compression type"""
+        for compression, magic in cls.MAGIC_NUMBERS.items():
+            if header.startswith(magic):
+                return compression
+
+        # Assume uncompressed tar
+        return CompressionType.NONE
 
     def _get_tarfile_mode(self, operation: OperationType) -> str:
         """Get tarfile mode string"""
         base_mode = "w" if operation == OperationType.COMPRESS else "r"
 
         # Check if compression module is available
-        if self.compression == CompressionType.GZIP and not HAS_GZIP:
-            raise RuntimeError("GZIP compression not available. Install zlib development libraries and rebuild Python.")
-        elif self.compression == CompressionType.BZIP2 and not HAS_BZ2:
-            raise RuntimeError("BZIP2 compression not available. Install bz2 development libraries and rebuild Python.")
-        elif self.compression == CompressionType.XZ and not HAS_LZMA:
-            raise RuntimeError(
-                "XZ/LZMA compression not available. Install lzma development libraries and rebuild Python.")
-        elif self.compression == CompressionType.LZ4 and not HAS_LZ4:
-            raise RuntimeError("LZ4 compression not available. Install with: pip install lz4")
-
-        # Standard tarfile supported modes
-        mode_suffix = {
-            CompressionType.GZIP: ":gz",
-            CompressionType.BZIP2: ":bz2",
-            CompressionType.XZ: ":xz",
-            CompressionType.NONE: ""
-        }
+        available, message = self.MODULE_REQUIREMENTS.get(self.compression, (True, None))
+        if not available:
+            raise RuntimeError(message)
 
-        if self.compression in mode_suffix:
-            return base_mode + mode_suffix[self.compression]
-        elif self.compression == CompressionType.LZ4:
-            # LZ4 needs special handling
-            return base_mode  # Use uncompressed mode, handle LZ4 separately
-        else:
-            raise ValueError(f"Unsupported compression type: {self.compression}")
+        try:
+            return base_mode + self.TARFILE_MODE_SUFFIXES[self.compression]
+        except KeyError:
+            raise ValueError(f"Unsupported compression type: {self.compression}") from None
+
+    # Block size for multi-threaded gzip, each block becomes one gzip member
+    MGZIP_BLOCK_SIZE = 128 * 1024
+
+    # Block size for multi-threaded LZ4, each block becomes one LZ4 frame.
+    # 1 MiB keeps a block plus its output inside a typical L2 cache while
+    # still amortizing the per-block executor hand-off
+    LZ4_BLOCK_SIZE = 1024 * 1024
+
+    def _external_compressor_command(self) -> Optional[List[str]]:
+        """
+        Command line of an installed parallel compressor for this algorithm
+
+        Returns:
+            Argument list reading stdin and writing stdout, or None when
+            running single-threaded or no suitable tool is installed
+        """
+        if self.threads <= 1:
+            return None
+
+        threads = str(self.threads)
+        if self.compression == CompressionType.GZIP and shutil.which("pigz"):
+            # -n leaves the name and timestamp out of the gzip header
+            return ["pigz", "-c", "-n", f"-{self._gzip_level()}", "-p", threads]
+        if self.compression == CompressionType.BZIP2:
+            level = f"-{9 if self.compression_level is None else self.compression_level}"
+            if shutil.which("pbzip2"):
+                return ["pbzip2", "-c", level, f"-p{threads}"]
+            if shutil.which("lbzip2"):
+                return ["lbzip2", "-c", level, "-n", threads]
+        if self.compression == CompressionType.XZ:
+            preset = f"-{6 if self.compression_level is None else self.compression_level}"
+            if shutil.which("pixz"):
+                # -t skips pixz's appended file index, keeping a plain tar.xz
+                return ["pixz", "-t", preset, "-p", threads]
+            if shutil.which("xz"):
+                return ["xz", "-c", preset, f"-T{threads}"]
+        if self.compression == CompressionType.ZSTD and shutil.which("zstd"):
+            level = self._zstd_level()
+            if 1 <= level <= 19:
+                return ["zstd", "-c", "-q", f"-{level}", f"-T{threads}"]
+            if 20 <= level <= 22:
+                return ["zstd", "-c", "-q", "--ultra", f"-{level}", f"-T{threads}"]
+        return None
+
+    @staticmethod
+    def _wait_external_compressor(proc: subprocess.Popen):
+        """Close the compressor's input and fail if it did not finish cleanly"""
+        proc.stdin.close()
+        if proc.wait() != 0:
+            raise RuntimeError(f"{proc.args[0]} exited with status {proc.returncode}")
+
+    def _use_isal_threaded(self) -> bool:
+        """Whether gzip streams should be deflated by ISA-L on several threads"""
+        return self.compression == CompressionType.GZIP and HAS_ISAL_THREADED and self.threads > 1
+
+    def _use_mgzip(self) -> bool:
+        """Whether gzip streams should be deflated on several threads"""
+        return self.compression == CompressionType.GZIP and HAS_MGZIP and self.threads > 1
+
+    def _use_isal(self) -> bool:
+        """Whether gzip streams should go through the ISA-L backend"""
+        return self.compression == CompressionType.GZIP and HAS_ISAL
+
+    def _gzip_level(self) -> int:
+        """Gzip level in effect, tarfile's default is 9"""
+        return 9 if self.compression_level is None else self.compression_level
+
+    def _zstd_level(self) -> int:
+        """Zstd level in effect, zstd's own default is 3"""
+        return 3 if self.compression_level is None else self.compression_level
+
+    def _level_kwargs(self) -> Dict[str, int]:
+        """Keyword arguments carrying the compression level to tarfile.open"""
+        if self.compression_level is None:
+            return {}
+        if self.compression in (CompressionType.GZIP, CompressionType.BZIP2):
+            return {"compresslevel": self.compression_level}
+        if self.compression == CompressionType.XZ:
+            return {"preset": self.compression_level}
+        return {}
+
+    def _gzip_mtime(self) -> Optional[int]:
+        """Timestamp for gzip headers, None lets the writer use the current time"""
+        return 0 if self.reproducible else None
+
+    def _isal_level(self) -> int:
+        """Map the 1-9 compression level onto ISA-L's 0-3 range"""
+        level = min(max(self._gzip_level(), 1), 9)
+        return round((level - 1) * isal_zlib.ISAL_BEST_COMPRESSION / 8)
+
+    def _open_tar_for_writing(
+            self,
+            output_file: Union[Path, BinaryIO],
+            stack: ExitStack
+    ) -> tarfile.TarFile:
+        """
+        Open a tar archive for writing, registering every layer on the stack
+
+        Args:
+            output_file: Output file path or BytesIO object
+            stack: ExitStack that closes tar, compressor and file in order
+
+        Returns:
+            Open TarFile object
+        """
+        is_memory = isinstance(output_file, (BinaryIO, BytesIO))
+
+        command = None if is_memory else self._external_compressor_command()
+        if command:
+            # Stream the tar through pigz/pbzip2/pixz/xz -T/zstd -T, compressing on all threads
+            # outside the GIL; the callback runs after tar has flushed its end blocks
+            raw = stack.enter_context(open(output_file, 'wb'))
+            self._opened_output = Path(output_file)
+            try:
+                proc = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=raw)
+            except OSError:
+                raw.close()
+                proc = None  # Fall back to the in-process compressors below
+            if proc is not None:
+                stack.callback(self._wait_external_compressor, proc)
+                return stack.enter_context(
+                    tarfile.open(fileobj=proc.stdin, mode='w|', bufsize=self.STREAM_BUFFER_SIZE)
+                )
+
+        if self._use_isal_threaded():
+            # One gzip stream, blocks deflated by ISA-L on worker threads;
+            # the writer cannot seek, so tar is written in stream mode.
+            # Level 0 overflows the per-block output buffer on incompressible data
+            raw = self._open_output(output_file, stack)
+            gz = stack.enter_context(igzip_threaded.open(
+                raw, 'wb', compresslevel=max(self._isal_level(), 1), threads=self.threads
+            ))
+            return stack.enter_context(
+                tarfile.open(fileobj=gz, mode='w|', bufsize=self.STREAM_BUFFER_SIZE)
+            )
+
+        if self._use_mgzip():
+            # Independent gzip members deflated in parallel, readable by any gzip.
+            # mgzip queues large writes without copying them, so the tar goes
+            # through stream mode: its block buffer hands over fresh bytes
+            # instead of slices of the reused copy buffer
+            raw = self._open_output(output_file, stack)
+            gz = stack.enter_context(mgzip.MultiGzipFile(
+                fileobj=raw,
+                mode='wb',
+                compresslevel=self._gzip_level(),
+                thread=self.threads,
+                blocksize=self.MGZIP_BLOCK_SIZE,
+                mtime=self._gzip_mtime()
+            ))
+            return stack.enter_context(
+                tarfile.open(fileobj=gz, mode='w|', bufsize=self.STREAM_BUFFER_SIZE)
+            )
+
+        if self.compression == CompressionType.ZSTD:
+            # zstd has no tarfile mode, stream the tar through a zstd writer
+            raw = self._open_output(output_file, stack)
+            # threads=0 compresses on the calling thread, N>0 spawns N workers
+            cctx = zstandard.ZstdCompressor(
+                level=self._zstd_level(),
+                threads=self.threads if self.threads > 1 else 0
+            )
+            zw = stack.enter_context(cctx.stream_writer(raw, closefd=False))
+            return stack.enter_context(
+                tarfile.open(fileobj=zw, mode='w|', bufsize=self.STREAM_BUFFER_SIZE)
+            )
+
+        if self.compression == CompressionType.LZ4:
+            # Stream the tar straight into LZ4 frames, no intermediate tar
+            raw = self._open_output(output_file, stack)
+            level = self.compression_level or 0
+            if self.threads > 1:
+                lz = stack.enter_context(
+                    ParallelLZ4Writer(raw, self.LZ4_BLOCK_SIZE, self.threads, level)
+                )
+            else:
+                lz = stack.enter_context(lz4.frame.open(
+                    raw, 'wb', compression_level=level, block_size=lz4.frame.BLOCKSIZE_MAX1MB
+                ))
+            return stack.enter_context(
+                tarfile.open(fileobj=lz, mode='w|', bufsize=self.STREAM_BUFFER_SIZE)
+            )
+
+        if self._use_isal():
+            # Feed an uncompressed tar stream through ISA-L deflate
+            raw = self._open_output(output_file, stack)
+            gz = stack.enter_context(
+                igzip.IGzipFile(
+                    filename='', fileobj=raw, mode='wb', compresslevel=self._isal_level(), mtime=self._gzip_mtime()
+                )
+            )
+            return stack.enter_context(tarfile.open(fileobj=gz, mode='w'))
+
+        mode = self._get_tarfile_mode(OperationType.COMPRESS)
+        kwargs = self._level_kwargs()
+
+        if self.compression == CompressionType.GZIP and self.reproducible:
+            # tarfile's gz mode stamps the current time and file name into the
+            # gzip header, so build the GzipFile here with neither
+            raw = self._open_output(output_file, stack)
+            gz = stack.enter_context(gzip.GzipFile(
+                filename='', mode='wb', compresslevel=self._gzip_level(), fileobj=raw, mtime=0
+            ))
+            return stack.enter_context(tarfile.open(fileobj=gz, mode='w'))
+
+        if is_memory:
+            # For BinaryIO objects (like BytesIO), only use fileobj parameter
+            return stack.enter_context(tarfile.open(fileobj=output_file, mode=mode, **kwargs))
+        # The name still goes into the gzip header, the buffered file takes the writes
+        raw = self._open_output(output_file, stack)
+        return stack.enter_context(tarfile.open(name=str(output_file), fileobj=raw, mode=mode, **kwargs))
+
+    # Write buffer of archive files: compressors emit many small pieces and
+    # tar adds 512-byte headers and padding, 1 MiB turns them into few syscalls
+    OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+    # Block size of tarfile's stream modes ('w|', 'r|'). The 10 KiB default
+    # re-slices the pending bytes once per block, so each 1 MiB body chunk
+    # was copied about a hundred times on its way to the compressor
+    STREAM_BUFFER_SIZE = 1024 * 1024
+
+    # Read buffer of archive files: bz2 and lzma pull 8 KiB at a time, so
+    # the default buffer turned every few compressed blocks into a syscall
+    INPUT_BUFFER_SIZE = 128 * 1024
+
+    def _open_output(self, output_file: Union[Path, BinaryIO], stack: ExitStack) -> BinaryIO:
+        """
+        Archive file to write compressed bytes to, registered on the stack
+
+        Args:
+            output_file: Output file path or BytesIO object
+            stack: ExitStack that closes the file after the compressor
+
+        Returns:
+            output_file itself for in-memory output, else a buffered file
+        """
+        if isinstance(output_file, (BinaryIO, BytesIO)):
+            return output_file
+        raw = stack.enter_context(open(output_file, 'wb', buffering=self.OUTPUT_BUFFER_SIZE))
+        self._opened_output = Path(output_file)
+        return raw
+
+    def _open_tar_for_reading(
+            self,
+            archive_file: Union[Path, BinaryIO],
+            stack: ExitStack
+    ) -> tarfile.TarFile:
+        """
+        Open a tar archive for reading, registering it on the stack
+
+        Args:
+            archive_file: Archive file path or BytesIO object
+            stack: ExitStack that closes the archive
+
+        Returns:
+            Open TarFile object
+        """
+        mode = self._get_tarfile_mode(OperationType.DECOMPRESS)
+
+        if self.compression in (CompressionType.LZ4, CompressionType.ZSTD):
+            # Frame formats are read as a tar stream straight off the
+            # decompressor, so members must be consumed in archive order
+            reader = stack.enter_context(self._open_frame_reader(archive_file))
+            return stack.enter_context(
+                tarfile.open(fileobj=reader, mode='r|', bufsize=self.STREAM_BUFFER_SIZE)
+            )
+
+        if self._use_isal():
+            # ISA-L inflates several times faster than zlib but cannot seek
+            # backwards, so the tar is read as a stream like the frame formats
+            is_memory = isinstance(archive_file, (BinaryIO, BytesIO))
+            raw = archive_file if is_memory else stack.enter_context(
+                open(archive_file, 'rb', buffering=self.INPUT_BUFFER_SIZE)
+            )
+            gz = stack.enter_context(igzip.IGzipFile(fileobj=raw, mode='rb'))
+            return stack.enter_context(
+                tarfile.open(fileobj=gz, mode='r|', bufsize=self.STREAM_BUFFER_SIZE)
+            )
+
+        if self.compression == CompressionType.BZIP2 and HAS_INDEXED_BZIP2:
+            # Decodes bzip2 blocks in parallel and keeps a block index, so
+            # seeking back to a member does not restart decompression
+            source = archive_file if isinstance(archive_file, (BinaryIO, BytesIO)) else str(archive_file)
+            bz = stack.enter_context(indexed_bzip2.open(source, parallelization=self.threads))
+            return stack.enter_context(tarfile.open(fileobj=bz, mode='r:'))
+
+        if isinstance(archive_file, (BinaryIO, BytesIO)):
+            return stack.enter_context(tarfile.open(fileobj=archive_file, mode=mode))
+        raw = stack.enter_context(open(archive_file, 'rb', buffering=self.INPUT_BUFFER_SIZE))
+        return stack.enter_context(tarfile.open(fileobj=raw, mode=mode))
+
+    @staticmethod
+    def _walk_files(root: Union[str, Path], sort: bool = False):
+        """
+        Yield os.DirEntry objects for every regular file below root
+
+        Uses an explicit os.scandir stack instead of Path.rglob, so each
+        entry reuses the cached d_type and stat result. Directory symlinks
+        are not followed.
+
+        Args:
+            root: Directory to walk
+            sort: Visit entries by name instead of in file system order
+        """
+        stack = [os.fspath(root)]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=attrgetter('name')) if sort else it
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+
+    def _source_stat(self, path: Path) -> Optional[os.stat_result]:
+        """
+        Stat a source path once per operation
+
+        Replaces the is_file()/is_dir()/stat() calls, which cost a stat()
+        syscall each. Symlinks are followed as before; missing paths give None.
+        """
+        try:
+            return self._source_stats[path]
+        except KeyError:
+            pass
+        try:
+            result = os.stat(path)
+        except (OSError, ValueError):
+            result = None
+        self._source_stats[path] = result
+        return result
+
+    def _source_mode(self, path: Path) -> int:
+        """st_mode of a source path, 0 if it does not exist"""
+        result = self._source_stat(path)
+        return result.st_mode if result is not None else 0
+
+    def _set_base_paths(self, paths: List[Path], use_relative_paths: bool):
+        """Reset the per-operation source caches and record each source's base path"""
+        self._base_paths.clear()
+        self._source_stats.clear()
+        self._source_entries.clear()
+        if use_relative_paths:
+            for path in paths:
+                if stat.S_ISREG(self._source_mode(path)):
+                    # For files, use the parent directory as base
+                    self._base_paths[path] = path.parent
+                else:
+                    # For directories, use the directory itself as base
+                    self._base_paths[path] = path
 
     def _calculate_total_size(self, paths: List[Path]) -> tuple[int, int]:
-        """Calculate total file count and size"""
+        """
+        Calculate total file count and size
+
+        This is the only walk of each directory source: the entries are
+        kept in _source_entries, with their stat results cached, and the
+        archive is written from that list. The size of already-compressed
+        files is kept in _incompressible_size.
+        """
         total_files = 0
         total_size = 0
+        incompressible_size = 0
+        suffixes = self.INCOMPRESSIBLE_SUFFIXES
 
         for path in paths:
-            if path.is_file():
+            mode = self._source_mode(path)
+            if stat.S_ISREG(mode):
                 total_files += 1
-                total_size += path.stat().st_size
-            elif path.is_dir():
-                for p in path.rglob("*"):
-                    if p.is_file():
-                        total_files += 1
-                        total_size += p.stat().st_size
-
+                size = self._source_stat(path).st_size
+                total_size += size
+                if path.name.rpartition('.')[2].lower() in suffixes:
+                    incompressible_size += size
+            elif stat.S_ISDIR(mode):
+                entries = self._scan_directory(path)
+                self._source_entries[path] = entries
+                total_files += len(entries)
+                for entry in entries:
+                    size = entry.stat().st_size
+                    total_size += size
+                    if entry.name.rpartition('.')[2].lower() in suffixes:
+                        incompressible_size += size
+
+        self._incompressible_size = incompressible_size
         return total_files, total_size
 
+    # Extensions of formats that are compressed already; deflate and friends
+    # save next to nothing on them while still spending full CPU time
+    INCOMPRESSIBLE_SUFFIXES = frozenset({
+        'jpg', 'jpeg', 'png', 'gif', 'webp', 'heic', 'avif',
+        'mp3', 'aac', 'ogg', 'opus', 'flac', 'm4a',
+        'mp4', 'm4v', 'mkv', 'mov', 'avi', 'webm',
+        'gz', 'tgz', 'bz2', 'tbz2', 'xz', 'txz', 'lz4', 'zst', 'zip', '7z', 'rar',
+        'jar', 'whl', 'apk', 'docx', 'xlsx', 'pptx', 'odt', 'epub', 'pdf',
+    })
+
+    # Share of input bytes in INCOMPRESSIBLE_SUFFIXES above which a warning is shown
+    INCOMPRESSIBLE_WARN_RATIO = 0.3
+
+    def _warn_if_incompressible(self, total_size: int):
+        """Suggest a cheaper algorithm when most of the input is already compressed"""
+        # LZ4 and zstd detect incompressible blocks and store them cheaply
+        slow = (CompressionType.GZIP, CompressionType.BZIP2, CompressionType.XZ)
+        if self.compression not in slow or not total_size:
+            return
+        ratio = self._incompressible_size / total_size
+        if ratio > self.INCOMPRESSIBLE_WARN_RATIO:
+            name = CompressionChecker.check_availability()[self.compression].name
+            self.console.print(
+                f"[yellow]{ratio:.0%} of the input is already compressed (images, video, archives); "
+                f"{name} will spend CPU time for little gain. "
+                f"Consider no compression or LZ4 (-t none / -t lz4 -L 0).[/yellow]"
+            )
+
+    def _scan_directory(self, dir_path: Path) -> List[os.DirEntry]:
+        """List the files below a directory, caching each entry's stat result"""
+        entries = list(self._walk_files(dir_path, sort=self.reproducible))
+        for entry in entries:
+            entry.stat()
+        return entries
+
+    # Minimum time between event loop yields in the per-member loops
+    YIELD_INTERVAL = 0.05
+
+    async def _maybe_yield(self):
+        """
+        Yield to the event loop, at most once per YIELD_INTERVAL
+
+        A bare asyncio.sleep(0) per file or chunk costs a full loop iteration
+        even when nothing else is waiting; throttling keeps other tasks
+        responsive without paying that on every small member.
+        """
+        now = time.monotonic()
+        if now - self._last_yield >= self.YIELD_INTERVAL:
+            self._last_yield = now
+            await asyncio.sleep(0)
+
+    # Minimum time between overall progress updates
+    PROGRESS_INTERVAL = 0.1
+
+    def _advance_overall(self, progress: Progress, task_id: int, advance: int = 0, flush: bool = False):
+        """
+        Advance the overall task, publishing at most once per PROGRESS_INTERVAL
+
+        Every Progress.update takes the display lock and records a speed
+        sample; with many small members that was a large share of the run.
+        Call with flush=True before changing the task's description.
+        """
+        self._pending_advance += advance
+        now = time.monotonic()
+        if flush or now - self._last_advance >= self.PROGRESS_INTERVAL:
+            if self._pending_advance:
+                progress.update(task_id, advance=self._pending_advance)
+                self._pending_advance = 0
+            self._last_advance = now
+
+    def _create_progress(self) -> Progress:
+        """
+        Progress display with the standard columns
+
+        Refreshes 4 times a second; each refresh re-renders every task,
+        and the eye cannot follow faster updates anyway.
+        """
+        return Progress(*PROGRESS_COLUMNS, TimeRemainingColumn(), console=self.console, refresh_per_second=4)
+
     async def _check_interrupt(self) -> bool:
         """Check and handle interrupt"""
         if self.interrupt_handler.interrupted and not self.interrupt_handler.user_confirmed:
@@ -680,20 +1422,16 @@ class AsyncTarProcessor:
         # Setup interrupt handling
         self.interrupt_handler.setup()
 
+        # Only a file this call opened (and so truncated) may be removed on
+        # failure; an existing archive that could not be opened stays put
+        completed = False
+        self._opened_output = None
         try:
             # Convert paths
             paths = [Path(p) for p in source_paths]
 
             # Determine base paths for relative path calculation
-            self._base_paths.clear()
-            if use_relative_paths:
-                for path in paths:
-                    if path.is_file():
-                        # For files, use the parent directory as base
-                        self._base_paths[path] = path.parent
-                    else:
-                        # For directories, use the directory itself as base
-                        self._base_paths[path] = path
+            self._set_base_paths(paths, use_relative_paths)
 
             # Check if output is BytesIO or file path
             is_memory_output = isinstance(output_file, (BytesIO, BinaryIO))
@@ -701,13 +1439,16 @@ class AsyncTarProcessor:
 
             # Calculate total size
             self.console.print("[cyan]Analyzing files...[/cyan]")
-            total_files, total_size = self._calculate_total_size(paths)
+            total_files, total_size = await asyncio.get_running_loop().run_in_executor(
+                None, self._calculate_total_size, paths
+            )
+            self._warn_if_incompressible(total_size)
 
             self.stats = OperationStats(
                 operation_type=OperationType.COMPRESS,
                 total_files=total_files,
                 total_size=total_size,
-                start_time=datetime.now()
+                start_time=time.perf_counter_ns()
             )
 
             # Display compression algorithm info
@@ -715,15 +1456,11 @@ class AsyncTarProcessor:
             comp_info = info_dict[self.compression]
             self.console.print(f"[green]Using {comp_info.name} compression[/green]")
 
-            if self.compression == CompressionType.LZ4:
-                # LZ4 needs special handling
-                success = await self._compress_with_lz4(paths, output_file, chunk_size)
-            else:
-                # Use standard tarfile handling
-                success = await self._compress_with_tarfile(paths, output_file, chunk_size)
+            success = await self._compress_with_tarfile(paths, output_file, chunk_size)
 
             if success:
-                self.stats.end_time = datetime.now()
+                completed = True
+                self.stats.end_time = time.perf_counter_ns()
                 # Get compressed file size
                 if is_memory_output:
                     self.stats.result_size = output_file.tell()
@@ -737,59 +1474,318 @@ class AsyncTarProcessor:
             self.console.print(f"[red]Error: {e}[/red]")
             return False
         finally:
+            if not completed:
+                self._remove_partial_output(self._opened_output)
             self.interrupt_handler.cleanup()
             self._base_paths.clear()  # Clean up base paths
+            self._source_entries.clear()
 
-    async def compress_to_memory(
+    async def compress_sources_parallel(
             self,
             source_paths: List[Union[str, Path]],
-            chunk_size: int = 1024 * 1024
-    ) -> Optional[BytesIO]:
+            output_file: Union[str, Path, BinaryIO],
+            workers: Optional[int] = None,
+            use_relative_paths: bool = True
+    ) -> bool:
         """
-        Compress files to memory (BytesIO)
+        Compress on several worker processes at once
+
+        The scanned files are split into shards of about PARALLEL_SHARD_SIZE
+        bytes, so a single large directory is spread over the workers too.
+        Each worker builds the tar members of one shard in memory and
+        compresses them into a self-contained stream. The streams are
+        concatenated in archive order and closed with a final stream holding
+        the end-of-archive blocks, which gzip, bzip2, xz, LZ4 and zstd
+        readers all treat as one archive.
 
         Args:
             source_paths: List of files or directories to compress
-            chunk_size: Chunk size for reading files
+            output_file: Output compressed file path or BytesIO object
+            workers: Worker processes, None = one per CPU
+            use_relative_paths: Whether to use relative paths in the archive
 
         Returns:
-            BytesIO object containing compressed data, or None if failed
+            bool: Whether completed successfully
         """
+        # Check compression availability
+        self._check_compression_availability()
+
+        # Setup interrupt handling
+        self.interrupt_handler.setup()
+
+        executor = None
+        partial_output = None
         try:
-            output = BytesIO()
-            success = await self.compress_with_progress(source_paths, output, chunk_size)
+            paths = [Path(p) for p in source_paths]
+            self._set_base_paths(paths, use_relative_paths)
 
-            if success:
-                output.seek(0)  # Reset position for reading
-                return output
-            else:
-                return None
-        except Exception as e:
-            self.console.print(f"[red]Error in compress_to_memory: {e}[/red]")
-            return None
+            is_memory_output = isinstance(output_file, (BytesIO, BinaryIO))
+            output_path = None if is_memory_output else Path(output_file)
 
-    async def compress_to_bytes(
-            self,
-            source_paths: List[Union[str, Path]],
-            chunk_size: int = 1024 * 1024
-    ) -> Optional[bytes]:
-        """
-        Compress files to bytes
+            self.console.print("[cyan]Analyzing files...[/cyan]")
+            total_files, total_size = await asyncio.get_running_loop().run_in_executor(
+                None, self._calculate_total_size, paths
+            )
+            self._warn_if_incompressible(total_size)
 
-        Args:
-            source_paths: List of files or directories to compress
-            chunk_size: Chunk size for reading files
+            self.stats = OperationStats(
+                operation_type=OperationType.COMPRESS,
+                total_files=total_files,
+                total_size=total_size,
+                start_time=time.perf_counter_ns()
+            )
 
-        Returns:
-            bytes containing compressed data, or None if failed
-        """
-        output = await self.compress_to_memory(source_paths, chunk_size)
-        if output:
-            return output.getvalue()
-        else:
-            return None
+            info_dict = CompressionChecker.check_availability()
+            self.console.print(f"[green]Using {info_dict[self.compression].name} compression[/green]")
 
-    async def compress_to_str(
+            # Only this method needs multiprocessing, keep it out of start-up
+            from concurrent.futures import ProcessPoolExecutor
+
+            shards = self._shard_members(paths)
+            workers = max(workers or os.cpu_count() or 1, 1)
+            executor = ProcessPoolExecutor(max_workers=workers)
+            loop = asyncio.get_running_loop()
+
+            def submit(members):
+                return loop.run_in_executor(
+                    executor, _compress_tar_shard,
+                    self.compression, self.compression_level, members, self.reproducible
+                )
+
+            with ExitStack() as stack:
+                out = output_file if is_memory_output else stack.enter_context(open(output_file, 'wb'))
+                # Set once the file is truncated, a failed open leaves it alone
+                partial_output = output_path
+                progress = stack.enter_context(self._create_progress())
+                overall_task = progress.add_task(
+                    f"[cyan]Compressing {len(paths)} sources", total=total_size or 1
+                )
+
+                # Keep two shards per worker in flight: enough to keep every
+                # worker busy, while finished streams wait in memory only briefly
+                queued = iter(shards)
+                pending = deque(submit(members) for members in islice(queued, 2 * workers))
+
+                # Streams are written in archive order as soon as each is ready
+                tar_offset = 0
+                while pending:
+                    stream, files, size, length = await pending.popleft()
+                    for members in islice(queued, 1):
+                        pending.append(submit(members))
+                    out.write(stream)
+                    tar_offset += length
+                    self.stats.processed_files += files
+                    self.stats.processed_size += size
+                    progress.update(overall_task, advance=size)
+
+                    if await self._check_interrupt():
+                        return False
+
+                # End-of-archive blocks, padded to a full record as tarfile does
+                end = 2 * tarfile.BLOCKSIZE
+                end += -(tar_offset + end) % tarfile.RECORDSIZE
+                out.write(_compress_block(self.compression, self.compression_level, bytes(end), self.reproducible))
+
+                progress.update(overall_task, description="[green]Compression complete!")
+
+            partial_output = None
+            self.stats.end_time = time.perf_counter_ns()
+            if is_memory_output:
+                self.stats.result_size = output_file.tell()
+            elif output_path.exists():
+                self.stats.result_size = output_path.stat().st_size
+            self._show_summary()
+            return True
+
+        except Exception as e:
+            self.console.print(f"[red]Error: {e}[/red]")
+            return False
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            self._remove_partial_output(partial_output)
+            self.interrupt_handler.cleanup()
+            self._base_paths.clear()
+            self._source_entries.clear()
+
+    # Uncompressed bytes per compress_sources_parallel shard
+    PARALLEL_SHARD_SIZE = 32 * 1024 * 1024
+
+    def _shard_members(self, paths: List[Path]) -> List[List[Tuple[str, str, os.stat_result]]]:
+        """
+        Split the scanned sources into shards for the worker processes
+
+        Archive names follow the same rules as _add_file_with_progress and
+        _add_directory_with_progress, and members keep their archive order.
+        A shard is closed once it holds PARALLEL_SHARD_SIZE bytes; a larger
+        file gets a shard of its own.
+
+        Args:
+            paths: Sources, after _calculate_total_size has scanned them
+
+        Returns:
+            Lists of (path, archive name, lstat result) tuples
+        """
+        shards = []
+        members = []
+        size = 0
+        for path in paths:
+            mode = self._source_mode(path)
+            if stat.S_ISREG(mode):
+                # A file's base path is its parent directory, leaving just the file name
+                name = os.fspath(path)
+                arcname = path.name if path in self._base_paths else name
+                found = [(name, arcname, os.lstat(name))]
+            elif stat.S_ISDIR(mode):
+                prefix = os.path.join(os.fspath(self._base_paths.get(path, path)), "")
+                found = [
+                    (entry.path, entry.path[len(prefix):] if entry.path.startswith(prefix) else entry.path,
+                     entry.stat(follow_symlinks=False))
+                    for entry in self._source_entries[path]
+                ]
+            else:
+                continue
+
+            for member in found:
+                if members and size + member[2].st_size > self.PARALLEL_SHARD_SIZE:
+                    shards.append(members)
+                    members = []
+                    size = 0
+                members.append(member)
+                size += member[2].st_size
+        if members:
+            shards.append(members)
+        return shards
+
+    async def compress_bytes_with_progress(
+            self,
+            members: List[Tuple[str, bytes]],
+            output_file: Union[str, Path, BinaryIO],
+            chunk_size: int = 1024 * 1024
+    ) -> bool:
+        """
+        Compress in-memory data with progress display, without touching the filesystem
+
+        Args:
+            members: List of (archive name, file content) tuples
+            output_file: Output compressed file path or BytesIO object
+            chunk_size: Chunk size for reading files
+
+        Returns:
+            bool: Whether completed successfully
+        """
+        # Check compression availability
+        self._check_compression_availability()
+
+        # Setup interrupt handling
+        self.interrupt_handler.setup()
+
+        completed = False
+        self._opened_output = None
+        try:
+            is_memory_output = isinstance(output_file, (BytesIO, BinaryIO))
+            output_path = None if is_memory_output else Path(output_file)
+
+            self.stats = OperationStats(
+                operation_type=OperationType.COMPRESS,
+                total_files=len(members),
+                total_size=sum(len(data) for _, data in members),
+                start_time=time.perf_counter_ns()
+            )
+
+            # Display compression algorithm info
+            info_dict = CompressionChecker.check_availability()
+            comp_info = info_dict[self.compression]
+            self.console.print(f"[green]Using {comp_info.name} compression[/green]")
+
+            target = output_file if is_memory_output else output_path
+            success = await self._compress_with_tarfile(members, target, chunk_size)
+
+            if success:
+                completed = True
+                self.stats.end_time = time.perf_counter_ns()
+                if is_memory_output:
+                    self.stats.result_size = output_file.tell()
+                elif output_path.exists():
+                    self.stats.result_size = output_path.stat().st_size
+                self._show_summary()
+
+            return success
+
+        except Exception as e:
+            self.console.print(f"[red]Error: {e}[/red]")
+            return False
+        finally:
+            if not completed:
+                self._remove_partial_output(self._opened_output)
+            self.interrupt_handler.cleanup()
+
+    def _remove_partial_output(self, output_path: Optional[Path]):
+        """
+        Delete the archive file of a failed or interrupted compression
+
+        The output was truncated when writing started, so all that is left
+        is a tar without its end blocks (or a cut-off compressed stream),
+        which would only fail later. Also runs when a second Ctrl+C exits.
+        """
+        if output_path is None:
+            return
+        try:
+            output_path.unlink(missing_ok=True)
+        except OSError:
+            return
+        self.console.print(f"[yellow]Removed incomplete archive {output_path}[/yellow]")
+
+    async def compress_to_memory(
+            self,
+            source_paths: List[Union[str, Path]],
+            chunk_size: int = 1024 * 1024
+    ) -> Optional[BytesIO]:
+        """
+        Compress files to memory (BytesIO)
+
+        Args:
+            source_paths: List of files or directories to compress
+            chunk_size: Chunk size for reading files
+
+        Returns:
+            BytesIO object containing compressed data, or None if failed
+        """
+        try:
+            output = BytesIO()
+            success = await self.compress_with_progress(source_paths, output, chunk_size)
+
+            if success:
+                output.seek(0)  # Reset position for reading
+                return output
+            else:
+                return None
+        except Exception as e:
+            self.console.print(f"[red]Error in compress_to_memory: {e}[/red]")
+            return None
+
+    async def compress_to_bytes(
+            self,
+            source_paths: List[Union[str, Path]],
+            chunk_size: int = 1024 * 1024
+    ) -> Optional[bytes]:
+        """
+        Compress files to bytes
+
+        Args:
+            source_paths: List of files or directories to compress
+            chunk_size: Chunk size for reading files
+
+        Returns:
+            bytes containing compressed data, or None if failed
+        """
+        output = await self.compress_to_memory(source_paths, chunk_size)
+        if output:
+            return output.getvalue()
+        else:
+            return None
+
+    async def compress_to_str(
             self,
             source_paths: List[Union[str, Path]],
             chunk_size: int = 1024 * 1024
@@ -805,9 +1801,14 @@ class AsyncTarProcessor:
             base64 encoded string containing compressed data, or None if failed
         """
         import base64
-        data = await self.compress_to_bytes(source_paths, chunk_size)
-        if data:
-            return base64.b64encode(data).decode('ascii')
+        output = await self.compress_to_memory(source_paths, chunk_size)
+        if output:
+            # Encode straight from the BytesIO buffer, skipping the getvalue() copy
+            with output.getbuffer() as view:
+                if HAS_PYBASE64:
+                    # SIMD encoder, builds the str without an intermediate bytes object
+                    return pybase64.b64encode_as_string(view)
+                return base64.b64encode(view).decode('ascii')
         else:
             return None
 
@@ -888,7 +1889,7 @@ class AsyncTarProcessor:
             self.stats = OperationStats(
                 operation_type=OperationType.DECOMPRESS,
                 total_size=total_size,
-                start_time=datetime.now()
+                start_time=time.perf_counter_ns()
             )
 
             self.console.print(f"[cyan]Decompressing {archive_name}...[/cyan]")
@@ -898,15 +1899,10 @@ class AsyncTarProcessor:
             comp_info = info_dict[self.compression]
             self.console.print(f"[green]Using {comp_info.name} decompression[/green]")
 
-            if self.compression == CompressionType.LZ4:
-                # LZ4 needs special handling
-                success = await self._decompress_with_lz4(archive_file, output_path, chunk_size)
-            else:
-                # Use standard tarfile handling
-                success = await self._decompress_with_tarfile(archive_file, output_path, chunk_size)
+            success = await self._decompress_with_tarfile(archive_file, output_path, chunk_size)
 
             if success:
-                self.stats.end_time = datetime.now()
+                self.stats.end_time = time.perf_counter_ns()
                 self._show_summary()
 
             return success
@@ -921,7 +1917,7 @@ class AsyncTarProcessor:
 
     async def decompress_from_str(
             self,
-            archive_str: str,
+            archive_str: Union[str, bytes, memoryview],
             output_dir: Union[str, Path],
             chunk_size: int = 1024 * 1024
     ) -> bool:
@@ -929,7 +1925,7 @@ class AsyncTarProcessor:
         Decompress base64 encoded string archive
 
         Args:
-            archive_str: Base64 encoded string containing archive data
+            archive_str: Base64 encoded string, or its ASCII bytes (e.g. a mapped file)
             output_dir: Output directory for extracted files
             chunk_size: Chunk size for reading files
 
@@ -938,7 +1934,15 @@ class AsyncTarProcessor:
         """
         import base64
         try:
-            archive_bytes = base64.b64decode(archive_str)
+            if HAS_PYBASE64:
+                try:
+                    # Strict input takes the fastest SIMD decoder
+                    archive_bytes = pybase64.b64decode(archive_str, validate=True)
+                except ValueError:
+                    # Line breaks or other non-alphabet characters are skipped, as base64 does
+                    archive_bytes = pybase64.b64decode(archive_str)
+            else:
+                archive_bytes = base64.b64decode(archive_str)
             return await self.decompress_with_progress(archive_bytes, output_dir, chunk_size)
         except Exception as e:
             self.console.print(f"[red]Error decoding base64 string: {e}[/red]")
@@ -958,63 +1962,96 @@ class AsyncTarProcessor:
             List of tuples (filename, size, is_directory) or None if failed
         """
         try:
-            # Prepare archive for reading
-            if isinstance(archive_file, (str, Path)):
-                file_path = Path(archive_file)
-                if not file_path.exists():
-                    self.console.print(f"[red]Archive file not found: {file_path}[/red]")
-                    return None
+            archive_file = self._prepare_archive_for_reading(archive_file)
+            if archive_file is None:
+                return None
 
-                # Auto-detect compression type
-                self.compression = self._detect_compression_type(file_path)
-                self._check_compression_availability()
+            return await self._list_tarfile_contents(archive_file)
 
-            elif isinstance(archive_file, bytes):
-                # Auto-detect from bytes content
-                self.compression = self._detect_compression_from_bytes(archive_file)
-                self._check_compression_availability()
-                archive_file = BytesIO(archive_file)
+        except Exception as e:
+            self.console.print(f"[red]Error listing archive: {e}[/red]")
+            return None
 
-            elif isinstance(archive_file, (BinaryIO, BytesIO)):
-                # For BytesIO, try to detect compression
-                current_pos = archive_file.tell()
-                header = archive_file.read(16)
-                archive_file.seek(current_pos)
+    async def decompress_to_memory(
+            self,
+            archive_file: Union[str, Path, BinaryIO, bytes]
+    ) -> Optional[Dict[str, bytes]]:
+        """
+        Extract the regular files of an archive into memory
 
-                self.compression = self._detect_compression_from_bytes(header)
-                self._check_compression_availability()
+        Args:
+            archive_file: Archive file path, BytesIO, or bytes
 
-            # Get contents based on compression type
-            if self.compression == CompressionType.LZ4:
-                return await self._list_lz4_contents(archive_file)
-            else:
-                return await self._list_tarfile_contents(archive_file)
+        Returns:
+            Dict mapping member names to their contents, or None if failed
+        """
+        try:
+            archive_file = self._prepare_archive_for_reading(archive_file)
+            if archive_file is None:
+                return None
+
+            with ExitStack() as stack:
+                tar = self._open_tar_for_reading(archive_file, stack)
+                # Iterating works for the stream modes too, each member is
+                # read before the next header
+                return {
+                    member.name: tar.extractfile(member).read()
+                    for member in tar if member.isfile()
+                }
 
         except Exception as e:
-            self.console.print(f"[red]Error listing archive: {e}[/red]")
+            self.console.print(f"[red]Error extracting archive: {e}[/red]")
             return None
 
+    def _prepare_archive_for_reading(
+            self,
+            archive_file: Union[str, Path, BinaryIO, bytes]
+    ) -> Optional[Union[Path, BinaryIO]]:
+        """
+        Detect the compression of an archive and check it can be read
+
+        Args:
+            archive_file: Archive file path, BytesIO, or bytes
+
+        Returns:
+            Path or file object to open the archive from, None if the file is missing
+        """
+        if isinstance(archive_file, (str, Path)):
+            file_path = Path(archive_file)
+            if not file_path.exists():
+                self.console.print(f"[red]Archive file not found: {file_path}[/red]")
+                return None
+
+            # Auto-detect compression type
+            self.compression = self._detect_compression_type(file_path)
+            self._check_compression_availability()
+            return file_path
+
+        if isinstance(archive_file, bytes):
+            # Auto-detect from bytes content
+            self.compression = self._detect_compression_from_bytes(archive_file)
+            self._check_compression_availability()
+            return BytesIO(archive_file)
+
+        # For BytesIO, try to detect compression
+        current_pos = archive_file.tell()
+        header = archive_file.read(16)
+        archive_file.seek(current_pos)
+
+        self.compression = self._detect_compression_from_bytes(header)
+        self._check_compression_availability()
+        return archive_file
+
     # Internal compression methods
     async def _compress_with_tarfile(
             self,
-            paths: List[Path],
+            paths: List[Union[Path, Tuple[str, bytes]]],
             output_file: Union[Path, BinaryIO],
             chunk_size: int
     ) -> bool:
         """Compress using standard tarfile library with relative path support"""
         # Create progress bar
-        with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                MofNCompleteColumn(),
-                DownloadColumn(),
-                TimeElapsedColumn(),
-                TimeRemainingColumn(),
-                console=self.console,
-                refresh_per_second=10
-        ) as progress:
+        with self._create_progress() as progress:
 
             # Add tasks
             output_name = output_file.name if isinstance(output_file, Path) else "memory buffer"
@@ -1028,144 +2065,49 @@ class AsyncTarProcessor:
                 total=100,
                 visible=False
             )
+            self._pending_advance = 0
 
             # Create tar file
-            mode = self._get_tarfile_mode(OperationType.COMPRESS)
-
-            # Fixed: Correctly handle BinaryIO objects for tarfile.open
-            if isinstance(output_file, (BinaryIO, BytesIO)):
-                # For BinaryIO objects (like BytesIO), only use fileobj parameter
-                with tarfile.open(fileobj=output_file, mode=mode) as tar:
-                    for path in paths:
-                        if await self._check_interrupt():
-                            progress.update(overall_task, description="[red]Interrupted")
-                            return False
-
-                        # Get base path for this source
-                        base_path = self._base_paths.get(path)
-
-                        if path.is_file():
-                            await self._add_file_with_progress(
-                                tar, path, progress, overall_task, file_task, base_path
-                            )
-                        elif path.is_dir():
-                            await self._add_directory_with_progress(
-                                tar, path, progress, overall_task, file_task, base_path
-                            )
-            else:
-                # For file paths, use name parameter
-                with tarfile.open(name=str(output_file), mode=mode) as tar:
-                    for path in paths:
-                        if await self._check_interrupt():
-                            progress.update(overall_task, description="[red]Interrupted")
-                            return False
-
-                        # Get base path for this source
-                        base_path = self._base_paths.get(path)
-
-                        if path.is_file():
-                            await self._add_file_with_progress(
-                                tar, path, progress, overall_task, file_task, base_path
-                            )
-                        elif path.is_dir():
-                            await self._add_directory_with_progress(
-                                tar, path, progress, overall_task, file_task, base_path
-                            )
-
-            progress.update(overall_task, description="[green]Compression complete!")
-            return True
-
-    async def _compress_with_lz4(
-            self,
-            paths: List[Path],
-            output_file: Union[Path, BinaryIO],
-            chunk_size: int
-    ) -> bool:
-        """Compress using LZ4 with relative path support"""
-        import tempfile
-
-        # First create uncompressed tar file
-        if isinstance(output_file, BinaryIO):
-            # For memory output, use BytesIO for temporary tar
-            tmp_tar = BytesIO()
-            tmp_tar_path = None
-        else:
-            # For file output, use temporary file
-            with tempfile.NamedTemporaryFile(suffix='.tar', delete=False) as tmp:
-                tmp_tar_path = Path(tmp.name)
-            tmp_tar = tmp_tar_path
-
-        try:
-            # Create tar file with relative paths
-            self.console.print("[yellow]Creating tar archive...[/yellow]")
-            success = await self._compress_with_tarfile(paths, tmp_tar, chunk_size)
-
-            if not success:
-                return False
-
-            # Apply LZ4 compression
-            self.console.print("[yellow]Applying LZ4 compression...[/yellow]")
-
-            # [Rest of the LZ4 compression code remains the same...]
-            with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                    console=self.console
-            ) as progress:
-
-                if isinstance(tmp_tar, BytesIO):
-                    tar_size = tmp_tar.tell()
-                    tmp_tar.seek(0)
-                else:
-                    tar_size = tmp_tar_path.stat().st_size
-
-                compress_task = progress.add_task(
-                    "[cyan]LZ4 compressing...",
-                    total=tar_size
-                )
-
-                # LZ4 compression
-                if isinstance(tmp_tar, BytesIO):
-                    f_in = tmp_tar
-                else:
-                    f_in = open(tmp_tar_path, 'rb')
-
-                try:
-                    if isinstance(output_file, BinaryIO):
-                        f_out = lz4.frame.open(output_file, 'wb')
-                    else:
-                        f_out = lz4.frame.open(output_file, 'wb')
-
-                    while True:
-                        if await self._check_interrupt():
-                            return False
-
-                        chunk = f_in.read(chunk_size)
-                        if not chunk:
-                            break
-
-                        f_out.write(chunk)
-                        progress.update(compress_task, advance=len(chunk))
-
-                        # Yield control
-                        await asyncio.sleep(0)
-
-                    f_out.close()
-                finally:
-                    if not isinstance(tmp_tar, BytesIO):
-                        f_in.close()
+            with ExitStack() as stack:
+                tar = self._open_tar_for_writing(output_file, stack)
+                # One copy buffer for every member of the archive
+                buffer = memoryview(bytearray(chunk_size))
+                for path in paths:
+                    if await self._check_interrupt():
+                        break
 
-                progress.update(compress_task, description="[green]LZ4 compression complete!")
+                    if isinstance(path, tuple):
+                        # In-memory member: (archive name, content)
+                        await self._add_bytes_with_progress(
+                            tar, path[0], path[1], progress, overall_task
+                        )
+                        continue
+
+                    # Get base path for this source
+                    base_path = self._base_paths.get(path)
+
+                    mode = self._source_mode(path)
+                    if stat.S_ISREG(mode):
+                        await self._add_file_with_progress(
+                            tar, path, progress, overall_task, file_task, base_path,
+                            buffer=buffer
+                        )
+                    elif stat.S_ISDIR(mode):
+                        await self._add_directory_with_progress(
+                            tar, path, progress, overall_task, file_task, base_path,
+                            buffer=buffer
+                        )
+
+                if self._cancelled:
+                    # Also reached when the interrupt was confirmed inside a directory
+                    self._advance_overall(progress, overall_task, flush=True)
+                    progress.update(overall_task, description="[red]Interrupted")
+                    return False
 
+            self._advance_overall(progress, overall_task, flush=True)
+            progress.update(overall_task, description="[green]Compression complete!")
             return True
 
-        finally:
-            # Clean up temporary file
-            if tmp_tar_path and tmp_tar_path.exists():
-                tmp_tar_path.unlink()
-
     async def _add_file_with_progress(
             self,
             tar: tarfile.TarFile,
@@ -1173,7 +2115,10 @@ class AsyncTarProcessor:
             progress: Progress,
             overall_task: int,
             file_task: int,
-            base_path: Optional[Path] = None  # New parameter
+            base_path: Optional[Path] = None,  # New parameter
+            arcname: Optional[str] = None,
+            buffer: Optional[memoryview] = None,
+            file_stat: Optional[os.stat_result] = None
     ):
         """
         Add single file to tar with progress update
@@ -1185,62 +2130,427 @@ class AsyncTarProcessor:
             overall_task: Overall progress task ID
             file_task: File progress task ID
             base_path: Base path for calculating relative paths
+            arcname: Precomputed archive name, skips the relative path lookup
+            buffer: Reusable copy buffer, a 1MB one is allocated if omitted
+            file_stat: lstat() result from an earlier scan, skips another syscall
         """
-        file_size = file_path.stat().st_size
-
-        # Update file task
-        progress.update(
-            file_task,
-            description=f"[yellow]{file_path.name}",
-            total=file_size,
-            completed=0,
-            visible=True
-        )
-
-        # Use custom file object to track progress
-        class ProgressFileWrapper:
-            def __init__(self, file_obj, callback):
-                self.file_obj = file_obj
-                self.callback = callback
-                self.processed = 0
-
-            def read(self, size=-1):
-                data = self.file_obj.read(size)
-                if data:
-                    self.processed += len(data)
-                    self.callback(len(data))
-                return data
+        if file_stat is None:
+            file_stat = os.lstat(file_path)
+        file_size = file_stat.st_size
 
-            def __getattr__(self, name):
-                return getattr(self.file_obj, name)
+        # Calculate archive name (relative path)
+        if arcname is None:
+            if base_path:
+                try:
+                    # Calculate relative path from base path
+                    arcname = str(file_path.relative_to(base_path))
+                except ValueError:
+                    # If file is not under base_path, use just the filename
+                    arcname = file_path.name
+            else:
+                arcname = str(file_path)
+
+        if buffer is None:
+            buffer = memoryview(bytearray(1024 * 1024))
+
+        # Files copied in a single chunk would only flash the file bar
+        show_file = file_size > len(buffer)
+        if show_file:
+            progress.update(
+                file_task,
+                description=f"[yellow]{file_path.name}",
+                total=file_size,
+                completed=0,
+                visible=True
+            )
 
         def update_progress(bytes_read):
-            progress.update(file_task, advance=bytes_read)
-            progress.update(overall_task, advance=bytes_read)
+            if show_file:
+                progress.update(file_task, advance=bytes_read)
+            self._advance_overall(progress, overall_task, bytes_read)
             self.stats.processed_size += bytes_read
 
         # Add file to tar
         with open(file_path, 'rb') as f:
-            wrapped_file = ProgressFileWrapper(f, update_progress)
-            info = tar.gettarinfo(str(file_path))
+            if show_file and HAS_FADVISE:
+                # Read front to back once: ask for more aggressive readahead
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            info = self._tarinfo_from_stat(tar, str(file_path), arcname, file_stat)
+
+            if self.reproducible:
+                self._normalize_tarinfo(info)
+
+            if info.isreg():
+                # Members that fit the buffer go out in one write, larger ones in pieces
+                if show_file or not self._write_small_member(tar, info, f, buffer, update_progress):
+                    self._write_tar_header(tar, info)
+                    if info.size > len(buffer):
+                        # Large bodies: read and compress off the event loop thread,
+                        # zlib/bz2/lzma/zstd release the GIL while they work
+                        await asyncio.get_running_loop().run_in_executor(
+                            None, self._copy_file_into_tar, tar, info, f, buffer, update_progress
+                        )
+                    else:
+                        # A single chunk, not worth a thread handoff
+                        self._copy_file_into_tar(tar, info, f, buffer, update_progress)
+                    self._finish_tar_member(tar, info)
+                if show_file and HAS_FADVISE:
+                    # Archived data is rarely read again soon; drop it from the
+                    # page cache instead of evicting other processes' pages
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            else:
+                # Symlinks and other special files carry no data
+                tar.addfile(info)
 
-            # Calculate archive name (relative path)
-            if base_path:
+        self.stats.processed_files += 1
+        if show_file:
+            progress.update(file_task, visible=False)
+
+        await self._maybe_yield()
+
+    @classmethod
+    def _tarinfo_from_stat(
+            cls,
+            tar: tarfile.TarFile,
+            name: str,
+            arcname: str,
+            file_stat: os.stat_result
+    ) -> tarfile.TarInfo:
+        """
+        Build a file's TarInfo from its lstat() result
+
+        gettarinfo() would lstat the file again and resolve the owner names
+        through pwd/grp (NSS) for every member. Symlinks, special files and
+        files with several links, which may become hardlink members, still
+        go through gettarinfo().
+
+        Args:
+            tar: Tar file the member is written to
+            name: Path of the file on disk
+            arcname: Name of the member in the archive
+            file_stat: lstat() result of the file
+
+        Returns:
+            TarInfo for the member
+        """
+        if not stat.S_ISREG(file_stat.st_mode) or file_stat.st_nlink > 1:
+            info = tar.gettarinfo(name, arcname)
+            if info is not None:
+                info.mtime = int(info.mtime)
+            return info
+
+        info = tarfile.TarInfo(arcname.replace(os.sep, "/").lstrip("/"))
+        info.mode = file_stat.st_mode & 0o7777
+        info.uid = file_stat.st_uid
+        info.gid = file_stat.st_gid
+        info.size = file_stat.st_size
+        # Whole seconds fit the ustar field, a float would add a pax header
+        info.mtime = int(file_stat.st_mtime)
+        info.uname = cls._user_name(file_stat.st_uid)
+        info.gname = cls._group_name(file_stat.st_gid)
+        return info
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _user_name(uid: int) -> str:
+        """User name for a uid, empty if unknown"""
+        if not HAS_PWD:
+            return ""
+        try:
+            return pwd.getpwuid(uid).pw_name
+        except KeyError:
+            return ""
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _group_name(gid: int) -> str:
+        """Group name for a gid, empty if unknown"""
+        if not HAS_PWD:
+            return ""
+        try:
+            return grp.getgrgid(gid).gr_name
+        except KeyError:
+            return ""
+
+    @staticmethod
+    def _normalize_tarinfo(info: tarfile.TarInfo):
+        """Drop the time and ownership fields that vary between runs and machines"""
+        info.mtime = 0
+        info.uid = info.gid = 0
+        info.uname = info.gname = ""
+
+    # ustar header block: name, mode, uid, gid, size, mtime, checksum, type,
+    # linkname, magic+version, uname, gname, devmajor, devminor, prefix
+    USTAR_HEADER = struct.Struct("100s8s8s8s12s12s8s1s100s8s32s32s8s8s155s12x")
+
+    @classmethod
+    def _fast_ustar_header(cls, tar: tarfile.TarFile, info: tarfile.TarInfo) -> Optional[bytes]:
+        """
+        Build the header of a plain regular file without TarInfo.tobuf
+
+        Returns None unless the member needs no pax records or GNU extensions:
+        short ASCII names, integer mtime and numbers that fit the octal fields.
+        For those members the result is identical to tobuf's output.
+        """
+        if tar.format not in (tarfile.PAX_FORMAT, tarfile.USTAR_FORMAT):
+            return None
+        if info.type != tarfile.REGTYPE or info.pax_headers or info.linkname:
+            return None
+        mtime = info.mtime
+        if not (isinstance(mtime, int) and 0 <= mtime < 0o77777777777
+                and 0 <= info.size < 0o77777777777
+                and 0 <= info.uid < 0o7777777 and 0 <= info.gid < 0o7777777):
+            return None
+        if not (info.name.isascii() and info.uname.isascii() and info.gname.isascii()):
+            return None
+        name = info.name.encode("ascii")
+        uname = info.uname.encode("ascii")
+        gname = info.gname.encode("ascii")
+        if len(name) > 100 or len(uname) > 32 or len(gname) > 32:
+            return None
+
+        header = cls.USTAR_HEADER.pack(
+            name,
+            b"%07o\0" % (info.mode & 0o7777),
+            b"%07o\0" % info.uid,
+            b"%07o\0" % info.gid,
+            b"%011o\0" % info.size,
+            b"%011o\0" % mtime,
+            b"        ",  # Checksum is computed with this field as spaces
+            tarfile.REGTYPE,
+            b"",
+            tarfile.POSIX_MAGIC,
+            uname,
+            gname,
+            b"",
+            b"",
+            b""
+        )
+        return b"%s%06o\0%s" % (header[:148], sum(header), header[155:])
+
+    # tarfile.addfile copies bodies in 16KB reads; the helpers below write the
+    # same header/body/padding layout with a large buffer or os.sendfile
+    @classmethod
+    def _write_tar_header(cls, tar: tarfile.TarFile, info: tarfile.TarInfo):
+        """Write the header block(s) of a member, as tarfile.addfile does"""
+        header = cls._fast_ustar_header(tar, info)
+        if header is None:
+            header = info.tobuf(tar.format, tar.encoding, tar.errors)
+        tar.fileobj.write(header)
+        tar.offset += len(header)
+
+    @classmethod
+    def _write_small_member(
+            cls,
+            tar: tarfile.TarFile,
+            info: tarfile.TarInfo,
+            src: BinaryIO,
+            buffer: memoryview,
+            on_progress
+    ) -> bool:
+        """
+        Write header, body and padding of a small member in a single write
+
+        Small files otherwise cost three writes (header, body, padding),
+        each a separate compressor call. Nothing is written unless the
+        whole member was read.
+
+        Args:
+            tar: Tar file object
+            info: Regular file member, info.size bytes are read from src
+            src: Source file opened in binary mode
+            buffer: Reusable copy buffer the member is assembled in
+            on_progress: Called with the body size once written
+
+        Returns:
+            False, with nothing written, when the member does not fit the buffer
+        """
+        header = cls._fast_ustar_header(tar, info)
+        if header is None:
+            header = info.tobuf(tar.format, tar.encoding, tar.errors)
+        start = len(header)
+        end = start + info.size
+        total = -(-end // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+        if total > len(buffer):
+            return False
+
+        buffer[:start] = header
+        if src.readinto(buffer[start:end]) != info.size:
+            raise OSError(f"unexpected end of data in {info.name}")
+        buffer[end:total] = tarfile.NUL * (total - end)
+        tar.fileobj.write(buffer[:total])
+        tar.offset += total
+        tar.members.append(info)
+        on_progress(info.size)
+        return True
+
+    @staticmethod
+    def _finish_tar_member(tar: tarfile.TarFile, info: tarfile.TarInfo):
+        """Pad the member body to a whole block and record the member"""
+        blocks, remainder = divmod(info.size, tarfile.BLOCKSIZE)
+        if remainder:
+            tar.fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+            blocks += 1
+        tar.offset += blocks * tarfile.BLOCKSIZE
+        tar.members.append(info)
+
+    @staticmethod
+    def _copy_file_into_tar(
+            tar: tarfile.TarFile,
+            info: tarfile.TarInfo,
+            src: BinaryIO,
+            buffer: memoryview,
+            on_progress
+    ):
+        """
+        Copy a member body from an open file into the archive
+
+        Args:
+            tar: Tar file object, positioned right after the member header
+            info: Member being written, info.size bytes are copied
+            src: Source file opened in binary mode
+            buffer: Reusable copy buffer, also the in-kernel copy chunk size
+            on_progress: Called with the byte count of every copied chunk
+        """
+        out = tar.fileobj
+        remaining = info.size
+        chunk = len(buffer)  # Loop invariants are bound to locals up front
+
+        if isinstance(out, (BufferedWriter, FileIO)) and hasattr(os, 'sendfile'):
+            # Uncompressed archive on disk: the kernel moves the pages itself
+            out.flush()
+            sendfile = os.sendfile
+            out_fd, in_fd, offset = out.fileno(), src.fileno(), 0
+            if hasattr(os, 'copy_file_range'):
+                # Same file system: a server-side copy or reflink where supported
                 try:
-                    # Calculate relative path from base path
-                    arcname = file_path.relative_to(base_path)
-                    info.name = str(arcname)
-                except ValueError:
-                    # If file is not under base_path, use just the filename
-                    info.name = file_path.name
+                    while remaining:
+                        n = os.copy_file_range(in_fd, out_fd, min(remaining, chunk), offset)
+                        if not n:
+                            break
+                        offset += n
+                        remaining -= n
+                        on_progress(n)
+                except OSError:
+                    if offset:
+                        raise
+                    # EXDEV, EINVAL, ...: nothing written yet, use sendfile
+            while remaining:
+                n = sendfile(out_fd, in_fd, offset, min(remaining, chunk))
+                if not n:
+                    break
+                offset += n
+                remaining -= n
+                on_progress(n)
+        elif remaining > chunk:
+            # Several chunks: overlap reading with compression
+            remaining = AsyncTarProcessor._copy_file_pipelined(src, out, remaining, buffer, on_progress)
+        else:
+            readinto, write = src.readinto, out.write
+            while remaining:
+                n = readinto(buffer[:min(remaining, chunk)])
+                if not n:
+                    break
+                write(buffer[:n])
+                remaining -= n
+                on_progress(n)
+
+        if remaining:
+            raise OSError(f"unexpected end of data in {info.name}")
+
+    @staticmethod
+    def _copy_file_pipelined(src: BinaryIO, out: BinaryIO, remaining: int, buffer: memoryview, on_progress) -> int:
+        """
+        Copy bytes with a reader thread filling one half of the buffer
+        while the calling thread writes the other half
+
+        File reads and the zlib/bz2/lzma/zstd compressors release the GIL,
+        so disk I/O proceeds while the previous chunk is being compressed.
+        The output is only touched by the calling thread. Extraction uses
+        it the other way round, with a tar member as the source, so
+        decompression overlaps the writes to disk.
 
-            tar.addfile(info, wrapped_file)
+        Args:
+            src: Source file opened in binary mode
+            out: File object to write to
+            remaining: Number of bytes to copy
+            buffer: Copy buffer, split into the two halves
+            on_progress: Called with the byte count of every written chunk
+
+        Returns:
+            Bytes left uncopied, non-zero only if the source ended early
+        """
+        chunk = len(buffer) // 2
+        free = queue.SimpleQueue()
+        filled = queue.SimpleQueue()
+        free.put(buffer[:chunk])
+        free.put(buffer[chunk:2 * chunk])
+
+        def reader(left):
+            try:
+                while left:
+                    half = free.get()
+                    if half is None:
+                        return  # The writer gave up
+                    n = src.readinto(half[:min(left, chunk)])
+                    filled.put((half, n))
+                    if not n:
+                        return
+                    left -= n
+            except BaseException as e:
+                filled.put((None, e))
+
+        thread = threading.Thread(target=reader, args=(remaining,), daemon=True)
+        thread.start()
+        try:
+            write = out.write
+            while remaining:
+                half, n = filled.get()
+                if half is None:
+                    raise n
+                if not n:
+                    break
+                write(half[:n])
+                remaining -= n
+                on_progress(n)
+                free.put(half)
+        finally:
+            free.put(None)
+            thread.join()
+        return remaining
+
+    async def _add_bytes_with_progress(
+            self,
+            tar: tarfile.TarFile,
+            name: str,
+            data: bytes,
+            progress: Progress,
+            overall_task: int
+    ):
+        """
+        Add in-memory content to tar as a regular file
 
+        Args:
+            tar: Tar file object
+            name: Archive name of the member
+            data: File content
+            progress: Progress object for updates
+            overall_task: Overall progress task ID
+        """
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = 0 if self.reproducible else int(time.time())
+        info.mode = 0o644
+
+        self._write_tar_header(tar, info)
+        tar.fileobj.write(data)
+        self._finish_tar_member(tar, info)
+
+        self._advance_overall(progress, overall_task, info.size)
+        self.stats.processed_size += info.size
         self.stats.processed_files += 1
-        progress.update(file_task, visible=False)
 
-        # Check interrupt
-        await asyncio.sleep(0)  # Yield control
+        await self._maybe_yield()
 
     async def _add_directory_with_progress(
             self,
@@ -1249,7 +2559,8 @@ class AsyncTarProcessor:
             progress: Progress,
             overall_task: int,
             file_task: int,
-            base_path: Optional[Path] = None  # New parameter
+            base_path: Optional[Path] = None,  # New parameter
+            buffer: Optional[memoryview] = None
     ):
         """
         Recursively add directory to tar with relative paths
@@ -1261,19 +2572,33 @@ class AsyncTarProcessor:
             overall_task: Overall progress task ID
             file_task: File progress task ID
             base_path: Base path for calculating relative paths
+            buffer: Reusable copy buffer shared by all files
         """
         # Use the directory itself as base path if not specified
         if base_path is None:
             base_path = dir_path
 
-        for item in dir_path.rglob("*"):
+        # Entries under base_path get their archive name by slicing the path
+        prefix = os.path.join(os.fspath(base_path), "")
+
+        # Reuse the entries from the size calculation; walk in a worker
+        # thread only when the directory was not scanned beforehand
+        entries = self._source_entries.get(dir_path)
+        if entries is None:
+            entries = await asyncio.get_running_loop().run_in_executor(
+                None, self._scan_directory, dir_path
+            )
+
+        for entry in entries:
             if await self._check_interrupt():
                 return
 
-            if item.is_file():
-                await self._add_file_with_progress(
-                    tar, item, progress, overall_task, file_task, base_path
-                )
+            arcname = entry.path[len(prefix):] if entry.path.startswith(prefix) else None
+            await self._add_file_with_progress(
+                tar, Path(entry.path), progress, overall_task, file_task, base_path, arcname,
+                buffer=buffer, file_stat=entry.stat(follow_symlinks=False)
+            )
+
     # Internal decompression methods
     async def _decompress_with_tarfile(
             self,
@@ -1282,18 +2607,7 @@ class AsyncTarProcessor:
             chunk_size: int
     ) -> bool:
         """Decompress using standard tarfile library"""
-        with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                MofNCompleteColumn(),
-                DownloadColumn(),
-                TimeElapsedColumn(),
-                TimeRemainingColumn(),
-                console=self.console,
-                refresh_per_second=10
-        ) as progress:
+        with self._create_progress() as progress:
 
             overall_task = progress.add_task(
                 f"[green]Extracting to {output_dir}",
@@ -1306,58 +2620,30 @@ class AsyncTarProcessor:
                 visible=False
             )
 
-            # Open tar file
-            mode = self._get_tarfile_mode(OperationType.DECOMPRESS)
-
-            # Fixed: Correctly handle BinaryIO objects for tarfile.open
-            if isinstance(archive_file, (BinaryIO, BytesIO)):
-                # For BinaryIO objects (like BytesIO), only use fileobj parameter
-                with tarfile.open(fileobj=archive_file, mode=mode) as tar:
-                    # Count total files
-                    members = tar.getmembers()
-                    self.stats.total_files = len([m for m in members if m.isfile()])
-
-                    for member in members:
-                        if await self._check_interrupt():
-                            progress.update(overall_task, description="[red]Interrupted")
-                            return False
-
-                        if member.isfile():
-                            # Update progress
-                            progress.update(
-                                file_task,
-                                description=f"[yellow]{member.name}",
-                                total=member.size,
-                                completed=0,
-                                visible=True
-                            )
-
-                            # Extract with progress
-                            await self._extract_member_with_progress(
-                                tar, member, output_dir, progress, overall_task, file_task
-                            )
-
-                            self.stats.processed_files += 1
-                            progress.update(file_task, visible=False)
-                        else:
-                            # Just extract directories
-                            tar.extract(member, output_dir)
+            # One copy buffer shared by every extracted member
+            buffer = memoryview(bytearray(chunk_size))
+            self._pending_advance = 0
 
-                        await asyncio.sleep(0)  # Yield control
-            else:
-                # For file paths, use name parameter
-                with tarfile.open(name=str(archive_file), mode=mode) as tar:
-                    # Count total files
-                    members = tar.getmembers()
-                    self.stats.total_files = len([m for m in members if m.isfile()])
-
-                    for member in members:
-                        if await self._check_interrupt():
-                            progress.update(overall_task, description="[red]Interrupted")
-                            return False
-
-                        if member.isfile():
-                            # Update progress
+            # Open tar file
+            with ExitStack() as stack:
+                tar = self._open_tar_for_reading(archive_file, stack)
+
+                # Members are read as they are reached instead of listing the
+                # archive first, which would decompress it a second time and
+                # is impossible for stream-mode (frame format) archives
+                for member in tar:
+                    if member.isfile():
+                        self.stats.total_files += 1
+
+                    if await self._check_interrupt():
+                        self._advance_overall(progress, overall_task, flush=True)
+                        progress.update(overall_task, description="[red]Interrupted")
+                        return False
+
+                    if member.isfile():
+                        # Members read in a single chunk would only flash the file bar
+                        show_file = member.size > len(buffer)
+                        if show_file:
                             progress.update(
                                 file_task,
                                 description=f"[yellow]{member.name}",
@@ -1366,90 +2652,75 @@ class AsyncTarProcessor:
                                 visible=True
                             )
 
-                            # Extract with progress
-                            await self._extract_member_with_progress(
-                                tar, member, output_dir, progress, overall_task, file_task
-                            )
+                        # Extract with progress
+                        await self._extract_member_with_progress(
+                            tar, member, output_dir, progress, overall_task,
+                            file_task if show_file else None, buffer
+                        )
 
-                            self.stats.processed_files += 1
+                        self.stats.processed_files += 1
+                        if show_file:
                             progress.update(file_task, visible=False)
-                        else:
-                            # Just extract directories
-                            tar.extract(member, output_dir)
+                    elif member.islnk():
+                        # tarfile's own fallback seeks back to the link target,
+                        # which the stream-mode readers cannot do
+                        self._extract_hardlink(member, output_dir)
+                    else:
+                        # Just extract directories
+                        tar.extract(member, output_dir)
 
-                        await asyncio.sleep(0)  # Yield control
+                    await self._maybe_yield()
 
+            self._advance_overall(progress, overall_task, flush=True)
             progress.update(overall_task, description="[green]Extraction complete!")
 
         return True
 
-    async def _decompress_with_lz4(
-            self,
-            archive_file: Union[Path, BinaryIO],
-            output_dir: Path,
-            chunk_size: int
-    ) -> bool:
-        """Decompress using LZ4"""
-        import tempfile
+    @staticmethod
+    def _extract_hardlink(member: tarfile.TarInfo, output_dir: Path):
+        """
+        Recreate a hard link member from its already extracted target
 
-        with tempfile.NamedTemporaryFile(suffix='.tar', delete=False) as tmp:
-            tmp_tar_path = Path(tmp.name)
+        The target always precedes the link in the archive. A file left at
+        the destination by an earlier extraction is replaced, and where hard
+        links are not supported the target is copied instead.
 
+        Args:
+            member: Hard link member
+            output_dir: Output directory for extracted files
+        """
+        target = output_dir / member.linkname
+        link_path = output_dir / member.name
+        if not target.is_file():
+            raise tarfile.ExtractError(f"unable to resolve link inside archive: {member.name}")
+
+        link_path.parent.mkdir(parents=True, exist_ok=True)
+        if os.path.lexists(link_path):
+            link_path.unlink()
         try:
-            # First decompress LZ4
-            self.console.print("[yellow]Decompressing LZ4...[/yellow]")
-
-            with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                    console=self.console
-            ) as progress:
-
-                decompress_task = progress.add_task(
-                    "[cyan]LZ4 decompressing...",
-                    total=self.stats.total_size
-                )
+            os.link(target, link_path)
+        except OSError:
+            shutil.copy2(target, link_path)
 
-                # Open LZ4 file
-                if isinstance(archive_file, BinaryIO):
-                    f_in = lz4.frame.open(archive_file, 'rb')
-                else:
-                    f_in = lz4.frame.open(archive_file, 'rb')
-
-                try:
-                    with open(tmp_tar_path, 'wb') as f_out:
-                        while True:
-                            if await self._check_interrupt():
-                                return False
-
-                            chunk = f_in.read(chunk_size)
-                            if not chunk:
-                                break
-
-                            f_out.write(chunk)
-                            progress.update(decompress_task, advance=len(chunk))
-
-                            await asyncio.sleep(0)
-
-                finally:
-                    f_in.close()
-
-                progress.update(decompress_task, description="[green]LZ4 decompression complete!")
-
-            # Now extract tar file
-            self.console.print("[yellow]Extracting tar archive...[/yellow]")
-
-            # Update stats for tar extraction
-            self.stats.total_size = tmp_tar_path.stat().st_size
+    def _open_frame_reader(self, archive_file: Union[Path, BinaryIO]) -> BinaryIO:
+        """
+        Open a decompressing reader for LZ4/ZSTD archives
 
-            return await self._decompress_with_tarfile(tmp_tar_path, output_dir, chunk_size)
+        Args:
+            archive_file: Archive file path or BytesIO object
 
-        finally:
-            # Clean up temporary file
-            if tmp_tar_path.exists():
-                tmp_tar_path.unlink()
+        Returns:
+            Readable file object yielding the uncompressed tar stream
+        """
+        if self.compression == CompressionType.ZSTD:
+            is_memory = isinstance(archive_file, (BinaryIO, BytesIO))
+            source = archive_file if is_memory else open(
+                archive_file, 'rb', buffering=self.INPUT_BUFFER_SIZE
+            )
+            return zstandard.ZstdDecompressor().stream_reader(
+                source, read_across_frames=True, closefd=not is_memory
+            )
+        return lz4.frame.open(archive_file, 'rb')
 
     async def _extract_member_with_progress(
             self,
@@ -1458,9 +2729,21 @@ class AsyncTarProcessor:
             output_dir: Path,
             progress: Progress,
             overall_task: int,
-            file_task: int
+            file_task: Optional[int],
+            buffer: Optional[memoryview] = None
     ):
-        """Extract single member with progress"""
+        """
+        Extract single member with progress
+
+        Args:
+            tar: Tar file object
+            member: Member to extract
+            output_dir: Output directory for extracted files
+            progress: Progress object for updates
+            overall_task: Overall progress task ID
+            file_task: File progress task ID, None to skip per-file progress
+            buffer: Reusable copy buffer, a 64KB one is allocated if omitted
+        """
         # Create full path
         full_path = output_dir / member.name
         full_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1468,76 +2751,116 @@ class AsyncTarProcessor:
         # Extract with progress tracking
         extracted = tar.extractfile(member)
         if extracted:
-            bytes_written = 0
-            with open(full_path, 'wb') as f:
-                while True:
-                    chunk = extracted.read(8192)  # 8KB chunks
-                    if not chunk:
-                        break
+            if buffer is None:
+                buffer = memoryview(bytearray(64 * 1024))
+
+            def on_progress(n):
+                # Progress updates are lock protected, safe from a worker thread
+                if file_task is not None:
+                    progress.update(file_task, advance=n)
+                self._advance_overall(progress, overall_task, n)
+
+            slow_decoders = (CompressionType.BZIP2, CompressionType.XZ)
+
+            def copy_member():
+                with open(full_path, 'wb') as f:
+                    if self._copy_member_range(tar, member, f, len(buffer), on_progress):
+                        return
+                    if member.size > len(buffer) and self.compression in slow_decoders:
+                        # Decompress the next chunk on a reader thread while this
+                        # one writes the previous chunk to disk; for the fast
+                        # decoders the thread handoff costs more than it saves
+                        if self._copy_file_pipelined(extracted, f, member.size, buffer, on_progress):
+                            raise tarfile.ReadError(f"unexpected end of data in {member.name}")
+                        return
+                    readinto, write = extracted.readinto, f.write
+                    while True:
+                        n = readinto(buffer)
+                        if not n:
+                            break
 
-                    f.write(chunk)
-                    bytes_written += len(chunk)
+                        write(buffer[:n])
+                        on_progress(n)
 
-                    progress.update(file_task, advance=len(chunk))
-                    progress.update(overall_task, advance=len(chunk))
-                    self.stats.processed_size += len(chunk)
+            if member.size > len(buffer):
+                # Large members: decompress and write off the event loop thread
+                await asyncio.get_running_loop().run_in_executor(None, copy_member)
+            else:
+                # A single read, not worth a thread handoff
+                copy_member()
+            self.stats.processed_size += member.size
 
             # Set file permissions
             if hasattr(os, 'chmod'):
                 os.chmod(full_path, member.mode)
 
-    async def _list_tarfile_contents(
-            self,
-            archive_file: Union[Path, BinaryIO]
-    ) -> List[Tuple[str, int, bool]]:
-        """List contents of a tarfile"""
-        mode = self._get_tarfile_mode(OperationType.DECOMPRESS)
+    @staticmethod
+    def _copy_member_range(
+            tar: tarfile.TarFile,
+            member: tarfile.TarInfo,
+            dst: BinaryIO,
+            chunk_size: int,
+            on_progress
+    ) -> bool:
+        """
+        Copy a member body straight from an uncompressed archive on disk
 
-        # Fixed: Correctly handle BinaryIO objects for tarfile.open
-        if isinstance(archive_file, (BinaryIO, BytesIO)):
-            # For BinaryIO objects (like BytesIO), only use fileobj parameter
-            with tarfile.open(fileobj=archive_file, mode=mode) as tar:
-                contents = []
-                for member in tar.getmembers():
-                    contents.append((member.name, member.size, member.isdir()))
-                return contents
-        else:
-            # For file paths, use name parameter
-            with tarfile.open(name=str(archive_file), mode=mode) as tar:
-                contents = []
-                for member in tar.getmembers():
-                    contents.append((member.name, member.size, member.isdir()))
-                return contents
-
-    async def _list_lz4_contents(
-            self,
-            archive_file: Union[Path, BinaryIO]
-    ) -> List[Tuple[str, int, bool]]:
-        """List contents of LZ4 compressed tar"""
-        import tempfile
+        Uses os.copy_file_range, so the data never passes through Python
+        buffers. Only plain (non-sparse) members of an archive opened from
+        a real file qualify.
 
-        with tempfile.NamedTemporaryFile(suffix='.tar') as tmp:
-            # Decompress to temporary file
-            if isinstance(archive_file, BinaryIO):
-                f_in = lz4.frame.open(archive_file, 'rb')
-            else:
-                f_in = lz4.frame.open(archive_file, 'rb')
+        Args:
+            tar: Tar file object
+            member: Member to copy
+            dst: Destination file opened in binary mode
+            chunk_size: Bytes per copy_file_range call
+            on_progress: Called with the byte count of every copied chunk
+
+        Returns:
+            True if the member was copied, False if the caller must copy it
+        """
+        src = tar.fileobj
+        if isinstance(src, BufferedReader):
+            # Decompressing readers may also be BufferedReaders, with the
+            # compressed file behind fileno(); only a plain file qualifies
+            src = src.raw
+        if (not hasattr(os, 'copy_file_range') or member.sparse is not None
+                or not isinstance(src, FileIO)):
+            return False
 
+        in_fd, out_fd = src.fileno(), dst.fileno()
+        offset, remaining = member.offset_data, member.size
+        while remaining:
             try:
-                tmp.write(f_in.read())
-                tmp.flush()
+                n = os.copy_file_range(in_fd, out_fd, min(remaining, chunk_size), offset)
+            except OSError:
+                if remaining == member.size:
+                    return False  # Not supported for these files, nothing written yet
+                raise
+            if not n:
+                raise OSError(f"unexpected end of data in {member.name}")
+            offset += n
+            remaining -= n
+            on_progress(n)
+        return True
 
-                # List contents of tar
-                return await self._list_tarfile_contents(Path(tmp.name))
-            finally:
-                f_in.close()
+    async def _list_tarfile_contents(
+            self,
+            archive_file: Union[Path, BinaryIO]
+    ) -> List[Tuple[str, int, bool]]:
+        """List contents of a tarfile"""
+        with ExitStack() as stack:
+            tar = self._open_tar_for_reading(archive_file, stack)
+            return [(member.name, member.size, member.isdir()) for member in tar.getmembers()]
 
     def _show_summary(self):
         """Show operation summary"""
-        if not self.stats or not self.stats.start_time or not self.stats.end_time:
+        if not self.stats or self.stats.start_time is None or self.stats.end_time is None:
             return
 
-        duration = self.stats.end_time - self.stats.start_time
+        duration = (self.stats.end_time - self.stats.start_time) / 1e9
+        # Guard against a zero duration on very small inputs
+        per_second = 1 / max(duration, 1e-9)
 
         if self.stats.operation_type == OperationType.COMPRESS:
             # Compression summary
@@ -1553,7 +2876,9 @@ class AsyncTarProcessor:
 • Original size: {self._format_size(self.stats.total_size)}
 • Compressed size: {self._format_size(self.stats.result_size)}
 • Compression ratio: {compression_ratio:.1f}%
-• Time taken: {duration.total_seconds():.1f} seconds
+• Time taken: {duration:.1f} seconds
+• Throughput: {self._format_size(self.stats.total_size * per_second)}/s in, \
+{self._format_size(self.stats.result_size * per_second)}/s out
 • Compression type: {self.compression.name}
             """
             title = "Compression Statistics"
@@ -1565,7 +2890,8 @@ class AsyncTarProcessor:
 • Files extracted: {self.stats.processed_files}
 • Archive size: {self._format_size(self.stats.total_size)}
 • Bytes processed: {self._format_size(self.stats.processed_size)}
-• Time taken: {duration.total_seconds():.1f} seconds
+• Time taken: {duration:.1f} seconds
+• Throughput: {self._format_size(self.stats.processed_size * per_second)}/s
 • Compression type: {self.compression.name}
             """
             title = "Decompression Statistics"
@@ -1575,11 +2901,85 @@ class AsyncTarProcessor:
     @staticmethod
     def _format_size(size: int) -> str:
         """Format file size"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} PB"
+        # Each unit spans 10 bits, so the bit length picks it directly
+        units = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+        i = min((max(int(size), 1).bit_length() - 1) // 10, len(units) - 1)
+        return f"{size / (1 << (10 * i)):.2f} {units[i]}"
+
+
+def _compress_block(
+        compression: CompressionType,
+        compression_level: Optional[int],
+        data: bytes,
+        reproducible: bool = False
+) -> bytes:
+    """
+    Compress data into one complete stream of the given format
+
+    Args:
+        compression: Compression type
+        compression_level: Compression level, None = library default
+        data: Uncompressed bytes
+        reproducible: Leave the timestamp out of gzip headers
+
+    Returns:
+        Compressed stream, or data itself for NONE
+    """
+    if compression == CompressionType.GZIP:
+        return gzip.compress(
+            data, compresslevel=9 if compression_level is None else compression_level,
+            mtime=0 if reproducible else None
+        )
+    if compression == CompressionType.BZIP2:
+        return bz2.compress(data, 9 if compression_level is None else compression_level)
+    if compression == CompressionType.XZ:
+        return lzma.compress(data, preset=compression_level)
+    if compression == CompressionType.LZ4:
+        return lz4.frame.compress(data, **({} if compression_level is None else {"compression_level": compression_level}))
+    if compression == CompressionType.ZSTD:
+        return zstandard.ZstdCompressor(level=3 if compression_level is None else compression_level).compress(data)
+    return data
+
+
+def _compress_tar_shard(
+        compression: CompressionType,
+        compression_level: Optional[int],
+        members: List[Tuple[str, str, os.stat_result]],
+        reproducible: bool = False
+) -> Tuple[bytes, int, int, int]:
+    """
+    Build and compress one shard of tar members (runs in a worker process)
+
+    The members are written without end-of-archive blocks, so shards can be
+    concatenated into a single archive.
+
+    Args:
+        compression: Compression type
+        compression_level: Compression level, None = library default
+        members: (path, archive name, lstat result) tuples, see AsyncTarProcessor._shard_members
+        reproducible: Normalize member metadata, see AsyncTarProcessor
+
+    Returns:
+        Tuple of (compressed stream, file count, file bytes, uncompressed tar length)
+    """
+    buffer = BytesIO()
+    # Never closed: closing would append the end-of-archive blocks
+    # addfile() copies bodies in copybufsize pieces, 16KB unless set
+    tar = tarfile.open(fileobj=buffer, mode='w', copybufsize=1024 * 1024)
+    size = 0
+    for name, arcname, file_stat in members:
+        info = AsyncTarProcessor._tarinfo_from_stat(tar, name, arcname, file_stat)
+        if reproducible:
+            AsyncTarProcessor._normalize_tarinfo(info)
+        if info.isreg():
+            with open(name, 'rb') as f:
+                tar.addfile(info, f)
+            size += info.size
+        else:
+            tar.addfile(info)
+
+    stream = _compress_block(compression, compression_level, buffer.getvalue(), reproducible)
+    return stream, len(members), size, tar.offset
 
 
 class InteractiveMode:
@@ -1636,8 +3036,8 @@ class InteractiveMode:
             default = "0"
         else:
             choices = [t[0] for t in available_types]
-            # Default to first available algorithm
-            default = "1"
+            # Default to zstd, the balanced choice, else the first available algorithm
+            default = next((num for num, comp_type in available_types if comp_type == CompressionType.ZSTD), "1")
 
         while True:
             choice = Prompt.ask(
@@ -1740,26 +3140,54 @@ class InteractiveMode:
                 return output_dir
 
 
-async def main():
+# Compression names accepted by -t/--type
+CLI_COMPRESSION_TYPES = {
+    "gz": CompressionType.GZIP,
+    "bz2": CompressionType.BZIP2,
+    "xz": CompressionType.XZ,
+    "lz4": CompressionType.LZ4,
+    "zst": CompressionType.ZSTD,
+    "none": CompressionType.NONE
+}
+
+
+async def _run_processor(console: Console, operation) -> None:
+    """Await a compress/decompress call, exiting with status 1 if it fails"""
+    try:
+        success = await operation
+    except RuntimeError as e:
+        console.print(f"\n[red]{e}[/red]")
+        sys.exit(1)
+
+    if not success:
+        sys.exit(1)
+
+
+async def main(console: Optional[Console] = None):
     """Main function"""
     import argparse
-    import os
 
     parser = argparse.ArgumentParser(
         description="Async Tar Compression/Decompression Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Supported compression algorithms:
-  gz     - GZIP compression (default)
+  gz     - GZIP compression
   bz2    - BZIP2 compression (high compression ratio)
   xz     - XZ/LZMA compression (highest compression ratio)
   lz4    - LZ4 compression (fastest speed, requires lz4 installation)
+  zst    - Zstandard compression (fast with high ratio, requires zstandard installation)
   none   - Archive only, no compression
 
+Without -t, compression follows the output extension (.tar.gz/.tgz/.gz,
+.bz2, .xz, .lz4, .zst, .tar); other names get zst, or gz when zstandard
+is not installed.
+
 Examples:
   Compression:
     %(prog)s -c file1.txt dir1/ -o archive.tar.gz -t gz
     %(prog)s -c data/ -o archive.tar.lz4 -t lz4
+    %(prog)s -c data/ -o archive.tar.xz  # XZ, from the extension
 
   Decompression:
     %(prog)s -d archive.tar.gz -o output_dir/
@@ -1787,9 +3215,32 @@ Examples:
     parser.add_argument("-o", "--output", help="Output path (file for compress, directory for decompress)")
     parser.add_argument(
         "-t", "--type",
-        choices=["gz", "bz2", "xz", "lz4", "none", "auto"],
+        choices=[*CLI_COMPRESSION_TYPES, "auto"],
         default="auto",
-        help="Compression type (default: auto-detect for decompress, gz for compress)"
+        help="Compression type (default: auto-detect for decompress; for compress, from the "
+             "output extension, zst if it is not an archive extension)"
+    )
+    parser.add_argument(
+        "-L", "--level",
+        type=int,
+        help="Compression level (gz/bz2 1-9, xz 0-9, lz4 0-16, zst 1-22; default: library default). "
+             "Low levels trade ratio for much faster compression"
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Favor speed over ratio: the fastest level unless -L is given, and LZ4 "
+             "(gzip if lz4 is missing) when neither -t nor the output extension picks one"
+    )
+    parser.add_argument(
+        "-j", "--threads",
+        type=int,
+        help="Compression/decompression threads (default: CPU count - 1)"
+    )
+    parser.add_argument(
+        "--reproducible",
+        action="store_true",
+        help="Write byte-identical archives for identical inputs (zero timestamps and owners)"
     )
     parser.add_argument(
         "-i", "--interactive",
@@ -1814,7 +3265,7 @@ Examples:
 
     args = parser.parse_args()
 
-    console = Console()
+    console = console or CONSOLE
 
     # Check mode
     if args.check:
@@ -1834,7 +3285,7 @@ Examples:
 
     # List mode
     if args.list:
-        processor = AsyncTarProcessor()
+        processor = AsyncTarProcessor(console=console)
         contents = await processor.list_archive_contents(args.list)
 
         if contents:
@@ -1872,15 +3323,8 @@ Examples:
             output = interactive.get_output_path(compression)
 
             # Execute compression
-            try:
-                processor = AsyncTarProcessor(compression)
-                success = await processor.compress_with_progress(sources, output)
-
-                if not success:
-                    sys.exit(1)
-            except RuntimeError as e:
-                console.print(f"\n[red]{e}[/red]")
-                sys.exit(1)
+            processor = AsyncTarProcessor(compression, console=console)
+            await _run_processor(console, processor.compress_with_progress(sources, output))
 
         else:  # DECOMPRESS
             # Get parameters
@@ -1889,20 +3333,12 @@ Examples:
             output_dir = interactive.get_output_directory()
 
             # Execute decompression
-            try:
-                if compression:
-                    processor = AsyncTarProcessor(compression)
-                else:
-                    # Auto-detect
-                    processor = AsyncTarProcessor()
-
-                success = await processor.decompress_with_progress(archive, output_dir)
-
-                if not success:
-                    sys.exit(1)
-            except RuntimeError as e:
-                console.print(f"\n[red]{e}[/red]")
-                sys.exit(1)
+            if compression:
+                processor = AsyncTarProcessor(compression, console=console)
+            else:
+                # Auto-detect
+                processor = AsyncTarProcessor(console=console)
+            await _run_processor(console, processor.decompress_with_progress(archive, output_dir))
 
         return
 
@@ -1915,28 +3351,38 @@ Examples:
             sys.exit(1)
 
         # Determine compression type
-        compression_map = {
-            "gz": CompressionType.GZIP,
-            "bz2": CompressionType.BZIP2,
-            "xz": CompressionType.XZ,
-            "lz4": CompressionType.LZ4,
-            "none": CompressionType.NONE,
-            "auto": CompressionType.GZIP  # Default for compression
-        }
-
-        try:
-            # Create processor
-            processor = AsyncTarProcessor(compression_map[args.type])
-
-            # Execute compression
-            success = await processor.compress_with_progress(args.compress, args.output)
-
-            if not success:
-                sys.exit(1)
+        if args.type == "auto":
+            compression = AsyncTarProcessor.compression_for_output(args.output)
+        else:
+            compression = CLI_COMPRESSION_TYPES[args.type]
+        level = args.level
+
+        if args.fast:
+            # LZ4 runs close to memory bandwidth, so large trees are bound by the disk.
+            # A known extension keeps its algorithm, the archive must match its name
+            if args.type == "auto" and AsyncTarProcessor.compression_for_suffix(args.output) is None:
+                compression = CompressionType.LZ4 if HAS_LZ4 else CompressionType.GZIP
+            if level is None:
+                fastest_levels = {
+                    CompressionType.GZIP: 1,
+                    CompressionType.BZIP2: 1,
+                    CompressionType.XZ: 0,
+                    CompressionType.LZ4: 0,
+                    CompressionType.ZSTD: 1,
+                }
+                level = fastest_levels.get(compression)
+
+        # Create processor
+        processor = AsyncTarProcessor(
+            compression,
+            compression_level=level,
+            threads=args.threads,
+            reproducible=args.reproducible,
+            console=console
+        )
 
-        except RuntimeError as e:
-            console.print(f"\n[red]{e}[/red]")
-            sys.exit(1)
+        # Execute compression
+        await _run_processor(console, processor.compress_with_progress(args.compress, args.output))
 
     elif args.decompress:
         # Decompression mode
@@ -1945,34 +3391,25 @@ Examples:
         # Determine compression type
         if args.type == "auto":
             # Auto-detect
-            processor = AsyncTarProcessor()
+            processor = AsyncTarProcessor(threads=args.threads, console=console)
         else:
-            compression_map = {
-                "gz": CompressionType.GZIP,
-                "bz2": CompressionType.BZIP2,
-                "xz": CompressionType.XZ,
-                "lz4": CompressionType.LZ4,
-                "none": CompressionType.NONE
-            }
-            processor = AsyncTarProcessor(compression_map[args.type])
-
-        try:
-            # Execute decompression
-            success = await processor.decompress_with_progress(args.decompress, output_dir)
-
-            if not success:
-                sys.exit(1)
+            processor = AsyncTarProcessor(
+                CLI_COMPRESSION_TYPES[args.type], threads=args.threads, console=console
+            )
 
-        except RuntimeError as e:
-            console.print(f"\n[red]{e}[/red]")
-            sys.exit(1)
+        # Execute decompression
+        await _run_processor(console, processor.decompress_with_progress(args.decompress, output_dir))
     else:
         parser.print_help()
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if HAS_UVLOOP:
+            # Lower per-callback overhead than the default selector loop
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\nCancelled")
         sys.exit(1)
\ No newline at end of file
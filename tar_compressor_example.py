@@ -5,24 +5,33 @@ Async Tar Processor Usage Examples with Compression and Decompression
 
 import asyncio
 import base64
+import mmap
+import os
+import shutil
 import sys
-import tarfile
 import tempfile
 import time
-from io import BytesIO
+import traceback
+from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
-from rich.console import Console
 from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
+from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.table import Table
 
-from tar_compressor import AsyncTarProcessor, CompressionType, CompressionChecker, OperationType
+from tar_compressor import (
+    AsyncTarProcessor, CompressionType, CompressionChecker, CONSOLE, HAS_PYBASE64, HAS_UVLOOP
+)
+
+if HAS_PYBASE64:
+    import pybase64
 
 
 async def example_basic_compression_decompression():
     """Basic compression and decompression example"""
-    console = Console()
+    console = CONSOLE
     console.print("\n[bold cyan]=== Basic Compression & Decompression Example ===[/bold cyan]")
 
     # Create some test files
@@ -92,15 +101,18 @@ async def example_basic_compression_decompression():
         if success:
             console.print(f"\n[green]✓ Files extracted to: {extract_dir}[/green]")
 
-            # Verify extracted files
-            extracted_files = list(extract_dir.rglob("*"))
-            console.print(f"  Total files extracted: {len([f for f in extracted_files if f.is_file()])}")
-            console.print(f"  Total directories: {len([f for f in extracted_files if f.is_dir()])}")
+            # Verify extracted files; os.walk sorts entries by type without a stat per path
+            file_count = dir_count = 0
+            for _, dirnames, filenames in os.walk(extract_dir):
+                file_count += len(filenames)
+                dir_count += len(dirnames)
+            console.print(f"  Total files extracted: {file_count}")
+            console.print(f"  Total directories: {dir_count}")
 
 
 async def example_memory_operations_enhanced():
     """Enhanced memory operations with bytes and str support"""
-    console = Console()
+    console = CONSOLE
     console.print("\n[bold cyan]=== Enhanced Memory Operations Example ===[/bold cyan]")
 
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -193,13 +205,12 @@ async def example_memory_operations_enhanced():
 
 async def example_compression_availability():
     """Demonstrate compression availability checking and fallback"""
-    console = Console()
+    console = CONSOLE
     console.print("\n[bold cyan]=== Compression Availability Example ===[/bold cyan]")
 
     # Import our utility module
     from compression_utils import (
         check_compression_support,
-        get_available_algorithms,
         suggest_fallback_algorithm,
         test_compression_functionality
     )
@@ -315,110 +326,19 @@ if algo:
     console.print(Panel(syntax, title="Checking Compression Support", border_style="cyan"))
 
 
-async def example_different_compressions_comparison():
-    """Test different compression algorithms with compression and decompression"""
-    console = Console()
-    console.print("\n[bold cyan]=== Compression Algorithm Comparison ===[/bold cyan]")
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create different types of test data
-        console.print("\n[yellow]Creating test data...[/yellow]")
-
-        # Text data (high compression ratio)
-        text_file = Path(tmpdir) / "text_data.txt"
-        text_file.write_text("This is a repeated line of text data\n" * 10000)
-        console.print(f"  Text file: {text_file.stat().st_size:,} bytes")
-
-        # Random data (low compression ratio)
-        import random
-        random_file = Path(tmpdir) / "random_data.bin"
-        random_data = bytes(random.randint(0, 255) for _ in range(50000))
-        random_file.write_bytes(random_data)
-        console.print(f"  Random file: {random_file.stat().st_size:,} bytes")
-
-        # Test different algorithms
-        algo_info = CompressionChecker.check_availability()
-        results = []
-
-        console.print("\n[cyan]Testing compression algorithms:[/cyan]")
-
-        for comp_type in [CompressionType.GZIP, CompressionType.BZIP2,
-                          CompressionType.XZ, CompressionType.LZ4, CompressionType.NONE]:
-            if not algo_info[comp_type].available:
-                console.print(f"\n  [yellow]Skipping {comp_type.name} (not installed)[/yellow]")
-                continue
-
-            console.print(f"\n  [cyan]Testing {comp_type.name}...[/cyan]")
-
-            try:
-                # Compress
-                compressor = AsyncTarProcessor(comp_type)
-                output_file = Path(tmpdir) / f"test.tar{algo_info[comp_type].extension}"
-
-                compress_start = time.time()
-                success = await compressor.compress_with_progress(
-                    [text_file, random_file],
-                    output_file
-                )
-                compress_time = time.time() - compress_start
-
-                if success:
-                    compressed_size = output_file.stat().st_size
-
-                    # Decompress
-                    extract_dir = Path(tmpdir) / f"extract_{comp_type.value}"
-
-                    decompress_start = time.time()
-                    success = await compressor.decompress_with_progress(
-                        output_file,
-                        extract_dir
-                    )
-                    decompress_time = time.time() - decompress_start
-
-                    if success:
-                        results.append({
-                            'name': comp_type.name,
-                            'compressed_size': compressed_size,
-                            'compress_time': compress_time,
-                            'decompress_time': decompress_time,
-                            'desc': algo_info[comp_type].description
-                        })
-
-            except Exception as e:
-                console.print(f"    [red]Error: {e}[/red]")
-
-        # Display comparison results
-        if results:
-            console.print("\n\n[bold cyan]Compression Algorithm Performance Comparison:[/bold cyan]")
-
-            table = Table(show_header=True, header_style="bold magenta")
-            table.add_column("Algorithm", style="cyan")
-            table.add_column("Compressed Size", style="green")
-            table.add_column("Compression Ratio", style="yellow")
-            table.add_column("Compress Time", style="blue")
-            table.add_column("Decompress Time", style="blue")
-            table.add_column("Total Time", style="magenta")
+@dataclass(slots=True)
+class ComparisonResult:
+    """One row of the algorithm comparison table"""
+    name: str
+    compressed_size: int
+    compress_time: float
+    decompress_time: float
+    desc: str
 
-            # Calculate original size
-            original_size = text_file.stat().st_size + random_file.stat().st_size
 
-            for r in results:
-                compression_ratio = (1 - r['compressed_size'] / original_size) * 100
-                total_time = r['compress_time'] + r['decompress_time']
-
-                table.add_row(
-                    r['name'],
-                    f"{r['compressed_size']:,} B",
-                    f"{compression_ratio:.1f}%",
-                    f"{r['compress_time']:.2f}s",
-                    f"{r['decompress_time']:.2f}s",
-                    f"{total_time:.2f}s"
-                )
-
-            console.print(table)
-            console.print(f"\n[cyan]Original size: {original_size:,} bytes[/cyan]")
+async def example_different_compressions_comparison():
     """Test different compression algorithms with compression and decompression"""
-    console = Console()
+    console = CONSOLE
     console.print("\n[bold cyan]=== Compression Algorithm Comparison ===[/bold cyan]")
 
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -431,9 +351,8 @@ async def example_different_compressions_comparison():
         console.print(f"  Text file: {text_file.stat().st_size:,} bytes")
 
         # Random data (low compression ratio)
-        import random
         random_file = Path(tmpdir) / "random_data.bin"
-        random_data = bytes(random.randint(0, 255) for _ in range(50000))
+        random_data = os.urandom(50000)
         random_file.write_bytes(random_data)
         console.print(f"  Random file: {random_file.stat().st_size:,} bytes")
 
@@ -477,13 +396,13 @@ async def example_different_compressions_comparison():
                     decompress_time = time.time() - decompress_start
 
                     if success:
-                        results.append({
-                            'name': comp_type.name,
-                            'compressed_size': compressed_size,
-                            'compress_time': compress_time,
-                            'decompress_time': decompress_time,
-                            'desc': algo_info[comp_type].description
-                        })
+                        results.append(ComparisonResult(
+                            name=comp_type.name,
+                            compressed_size=compressed_size,
+                            compress_time=compress_time,
+                            decompress_time=decompress_time,
+                            desc=algo_info[comp_type].description
+                        ))
 
             except Exception as e:
                 console.print(f"    [red]Error: {e}[/red]")
@@ -504,15 +423,15 @@ async def example_different_compressions_comparison():
             original_size = text_file.stat().st_size + random_file.stat().st_size
 
             for r in results:
-                compression_ratio = (1 - r['compressed_size'] / original_size) * 100
-                total_time = r['compress_time'] + r['decompress_time']
+                compression_ratio = (1 - r.compressed_size / original_size) * 100
+                total_time = r.compress_time + r.decompress_time
 
                 table.add_row(
-                    r['name'],
-                    f"{r['compressed_size']:,} B",
+                    r.name,
+                    f"{r.compressed_size:,} B",
                     f"{compression_ratio:.1f}%",
-                    f"{r['compress_time']:.2f}s",
-                    f"{r['decompress_time']:.2f}s",
+                    f"{r.compress_time:.2f}s",
+                    f"{r.decompress_time:.2f}s",
                     f"{total_time:.2f}s"
                 )
 
@@ -522,7 +441,7 @@ async def example_different_compressions_comparison():
 
 async def example_auto_detection():
     """Demonstrate auto-detection of compression type"""
-    console = Console()
+    console = CONSOLE
     console.print("\n[bold cyan]=== Auto-Detection Example ===[/bold cyan]")
 
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -551,8 +470,11 @@ async def example_auto_detection():
 
             success = await compressor.compress_with_progress([test_dir], output_file)
             if success:
-                # Copy to file without extension
-                output_file_noext.write_bytes(output_file.read_bytes())
+                # Link to a name without extension, copying in the kernel where links are unsupported
+                try:
+                    os.link(output_file, output_file_noext)
+                except OSError:
+                    shutil.copyfile(output_file, output_file_noext)
                 archives.append((output_file_noext, comp_type))
                 console.print(f"  Created: {output_file_noext.name} ({comp_type.name})")
 
@@ -585,7 +507,7 @@ async def example_auto_detection():
 
 async def example_interrupt_handling_enhanced():
     """Enhanced interrupt handling for both compression and decompression"""
-    console = Console()
+    console = CONSOLE
     console.print("\n[bold cyan]=== Interrupt Handling Demo (Enhanced) ===[/bold cyan]")
 
     console.print(Panel(
@@ -639,13 +561,15 @@ async def example_interrupt_handling_enhanced():
                 await decompressor.decompress_with_progress(archive_file, extract_dir)
 
                 if extract_dir.exists():
-                    extracted_count = len(list(extract_dir.rglob("*")))
+                    extracted_count = sum(
+                        len(dirnames) + len(filenames) for _, dirnames, filenames in os.walk(extract_dir)
+                    )
                     console.print(f"\n[cyan]Files extracted: {extracted_count}[/cyan]")
 
 
 async def example_mixed_operations():
     """Example of mixed compression and decompression operations"""
-    console = Console()
+    console = CONSOLE
     console.print("\n[bold cyan]=== Mixed Operations Example ===[/bold cyan]")
 
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -670,8 +594,8 @@ async def example_mixed_operations():
         console.print("\n[cyan]Step 1: Compress to memory with different algorithms[/cyan]")
 
         archives = {}
+        algo_info = CompressionChecker.check_availability()
         for comp_type in [CompressionType.GZIP, CompressionType.BZIP2]:
-            algo_info = CompressionChecker.check_availability()
             if not algo_info[comp_type].available:
                 continue
 
@@ -688,7 +612,10 @@ async def example_mixed_operations():
 
         if CompressionType.GZIP in archives:
             # Convert GZIP archive to base64 string
-            archive_str = base64.b64encode(archives[CompressionType.GZIP]).decode('ascii')
+            if HAS_PYBASE64:
+                archive_str = pybase64.b64encode_as_string(archives[CompressionType.GZIP])
+            else:
+                archive_str = base64.b64encode(archives[CompressionType.GZIP]).decode('ascii')
             console.print(f"  GZIP → Base64 string: {len(archive_str):,} characters")
 
             # Extract from string
@@ -726,9 +653,23 @@ async def example_mixed_operations():
             console.print(f"  [cyan]Size difference: {size_diff:,} bytes saved with XZ[/cyan]")
 
 
+def write_base64(data, filename, chunk_size: int = 57 * 1024):
+    """
+    Write data base64 encoded to a file, one chunk at a time
+
+    chunk_size is a multiple of 3, so no padding appears inside the stream
+    and the file holds exactly what a single b64encode(data) would.
+    """
+    b64encode = pybase64.b64encode if HAS_PYBASE64 else base64.b64encode
+    view = memoryview(data)
+    with open(filename, 'wb') as f:
+        for start in range(0, len(view), chunk_size):
+            f.write(b64encode(view[start:start + chunk_size]))
+
+
 async def interactive_wizard():
     """Interactive wizard for compression/decompression"""
-    console = Console()
+    console = CONSOLE
 
     console.print(Panel.fit(
         "[bold cyan]Async Tar Processor - Interactive Wizard[/bold cyan]\n"
@@ -765,6 +706,13 @@ async def interactive_wizard():
 
         selected_type = next(a[1] for a in available if a[0] == algo_choice)
 
+        # zstd, lz4 and (with isal/mgzip) gzip compress on several threads
+        threads = None
+        if AsyncTarProcessor.supports_threads(selected_type):
+            threads = IntPrompt.ask("Compression threads",
+                                    default=max((os.cpu_count() or 1) - 1, 1))
+            threads = max(threads, 1)
+
         # Get source paths
         console.print("\n[cyan]Enter paths to compress (type 'done' when finished):[/cyan]")
         paths = []
@@ -793,7 +741,7 @@ async def interactive_wizard():
         output_choice = Prompt.ask("Select output type", choices=["1", "2", "3"], default="1")
 
         # Process
-        processor = AsyncTarProcessor(selected_type)
+        processor = AsyncTarProcessor(selected_type, threads=threads)
 
         if output_choice == "1":
             output_path = Prompt.ask("Output filename",
@@ -806,17 +754,21 @@ async def interactive_wizard():
                 console.print(f"\n[green]✓ Archive created in memory: {memory_archive.tell():,} bytes[/green]")
 
         else:  # base64 string
-            archive_str = await processor.compress_to_str(paths)
-            if archive_str:
-                console.print(f"\n[green]✓ Base64 archive created: {len(archive_str):,} characters[/green]")
+            # Keep the archive as bytes and encode on demand: the preview needs
+            # 75 bytes, and saving streams the encoding instead of building one string
+            memory_archive = await processor.compress_to_memory(paths)
+            if memory_archive:
+                with memory_archive.getbuffer() as view:
+                    encoded_length = 4 * ((len(view) + 2) // 3)
+                    console.print(f"\n[green]✓ Base64 archive created: {encoded_length:,} characters[/green]")
 
-                if Confirm.ask("Show preview?", default=True):
-                    console.print(f"Preview: {archive_str[:100]}...")
+                    if Confirm.ask("Show preview?", default=True):
+                        console.print(f"Preview: {base64.b64encode(view[:75]).decode('ascii')}...")
 
-                if Confirm.ask("Save to file?", default=False):
-                    output_file = Prompt.ask("Filename", default="archive.b64")
-                    Path(output_file).write_text(archive_str)
-                    console.print(f"[green]✓ Saved to {output_file}[/green]")
+                    if Confirm.ask("Save to file?", default=False):
+                        output_file = Prompt.ask("Filename", default="archive.b64")
+                        write_base64(view, output_file)
+                        console.print(f"[green]✓ Saved to {output_file}[/green]")
 
     elif choice == "2":
         # Decompression wizard
@@ -848,12 +800,28 @@ async def interactive_wizard():
             b64_input = Prompt.ask("")
 
             if b64_input.lower() == "file":
-                filename = Prompt.ask("Base64 file path")
-                b64_input = Path(filename).expanduser().read_text().strip()
+                filename = Path(Prompt.ask("Base64 file path")).expanduser()
+                if not filename.is_file() or not filename.stat().st_size:
+                    console.print(f"[red]File not found or empty: {filename}[/red]")
+                    return
+
+                output_dir = Prompt.ask("Output directory", default=".")
+
+                # Decode straight from the mapped file, no str copy of the text
+                with open(filename, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    end = len(mm)
+                    while end and mm[end - 1] in b" \t\r\n":
+                        end -= 1
+                    with memoryview(mm) as view:
+                        success = await processor.decompress_from_str(view[:end], output_dir)
+            else:
+                output_dir = Prompt.ask("Output directory", default=".")
 
-            output_dir = Prompt.ask("Output directory", default=".")
+                success = await processor.decompress_from_str(b64_input, output_dir)
 
-            success = await processor.decompress_from_str(b64_input, output_dir)
+        if not success:
+            console.print("[red]✗ Decompression failed[/red]")
 
     elif choice == "3":
         # List contents wizard
@@ -872,21 +840,23 @@ async def interactive_wizard():
         if contents:
             console.print(f"\n[cyan]Archive contains {len(contents)} items:[/cyan]")
 
-            # Group by directory
-            dirs = {}
+            # Split each name once and sort by (directory, file name); a plain
+            # string split instead of two Path objects per member. Interning
+            # makes equal directories one object, so the sort and groupby
+            # compare them by identity instead of character by character
+            entries = []
+            intern = sys.intern
             for name, size, is_dir in contents:
                 if is_dir:
                     continue
+                dir_name, _, filename = name.rpartition('/')
+                entries.append((intern(dir_name or '.'), filename, size))
+            entries.sort()
 
-                dir_name = str(Path(name).parent)
-                if dir_name not in dirs:
-                    dirs[dir_name] = []
-                dirs[dir_name].append((Path(name).name, size))
-
-            # Display grouped
-            for dir_name, files in sorted(dirs.items()):
+            # Display grouped by directory
+            for dir_name, files in groupby(entries, key=itemgetter(0)):
                 console.print(f"\n[yellow]{dir_name}/[/yellow]")
-                for filename, size in sorted(files):
+                for _, filename, size in files:
                     console.print(f"  {filename} ({processor._format_size(size)})")
 
     else:  # Memory operations test
@@ -895,7 +865,8 @@ async def interactive_wizard():
         # Create test data
         with tempfile.TemporaryDirectory() as tmpdir:
             test_file = Path(tmpdir) / "test.txt"
-            test_file.write_text("Test content for memory operations\n" * 100)
+            original = b"Test content for memory operations\n" * 100
+            test_file.write_bytes(original)
 
             processor = AsyncTarProcessor(CompressionType.GZIP)
 
@@ -923,21 +894,19 @@ async def interactive_wizard():
             # Test round-trip
             console.print("\n[cyan]Testing round-trip (compress → decompress)...[/cyan]")
 
-            extract_dir = Path(tmpdir) / "roundtrip"
-            success = await processor.decompress_from_str(s, extract_dir)
+            # Extract into memory and compare with the bytes written above
+            files = await processor.decompress_to_memory(base64.b64decode(s))
 
-            if success:
-                extracted_file = extract_dir / "test.txt"
-                if extracted_file.exists():
-                    if extracted_file.read_text() == test_file.read_text():
-                        console.print("   [green]✓ Round-trip successful - data matches![/green]")
-                    else:
-                        console.print("   [red]✗ Round-trip failed - data mismatch![/red]")
+            if files is not None and "test.txt" in files:
+                if files["test.txt"] == original:
+                    console.print("   [green]✓ Round-trip successful - data matches![/green]")
+                else:
+                    console.print("   [red]✗ Round-trip failed - data mismatch![/red]")
 
 
 async def run_comprehensive_tests():
     """Run comprehensive test suite"""
-    console = Console()
+    console = CONSOLE
 
     console.print(Panel.fit(
         "[bold cyan]Comprehensive Test Suite[/bold cyan]\n"
@@ -964,7 +933,6 @@ async def run_comprehensive_tests():
             console.print(f"[yellow]⚠ {name} interrupted by user[/yellow]")
         except Exception as e:
             console.print(f"[red]✗ {name} failed: {e}[/red]")
-            import traceback
             traceback.print_exc()
 
         if i < len(tests):
@@ -974,7 +942,7 @@ async def run_comprehensive_tests():
 
 async def main():
     """Main function"""
-    console = Console()
+    console = CONSOLE
 
     examples = [
         ("Basic Compression & Decompression", example_basic_compression_decompression),
@@ -1034,7 +1002,13 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if HAS_UVLOOP:
+            # Same event loop as the tar_compressor command line
+            import uvloop
+
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\nProgram interrupted")
         sys.exit(0)
\ No newline at end of file
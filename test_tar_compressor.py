@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Round-trip tests for AsyncTarProcessor
+
+Run with: python -m unittest test_tar_compressor
+"""
+
+import gzip
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rich.console import Console
+
+import tar_compressor
+from tar_compressor import AsyncTarProcessor, CompressionType
+
+
+class MgzipRoundTripTest(unittest.IsolatedAsyncioTestCase):
+    """GZIP with threads > 1 written by mgzip when igzip_threaded is missing"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.source = Path(self._tmp.name) / "src"
+        (self.source / "sub").mkdir(parents=True)
+        # Members well above the 128K at which mgzip queues writes without
+        # copying them, plus a small one that goes out in a single write
+        for i in range(4):
+            data = os.urandom(1000) * 300 + os.urandom(200 * 1024)
+            (self.source / "sub" / f"big{i}.bin").write_bytes(data)
+        (self.source / "small.txt").write_bytes(b"small member\n")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    @unittest.skipUnless(tar_compressor.HAS_MGZIP, "mgzip not installed")
+    async def test_compress_to_bytes_round_trip(self):
+        with mock.patch.object(tar_compressor, "HAS_ISAL_THREADED", False):
+            processor = AsyncTarProcessor(
+                CompressionType.GZIP, threads=4, console=Console(file=io.StringIO())
+            )
+            self.assertTrue(processor._use_mgzip())
+            data = await processor.compress_to_bytes([self.source])
+
+        self.assertIsNotNone(data)
+        # gzip checks the CRC of every member while decompressing
+        raw = gzip.decompress(data)
+
+        expected = {
+            path.relative_to(self.source).as_posix(): path.read_bytes()
+            for path in self.source.rglob("*") if path.is_file()
+        }
+        with tarfile.open(fileobj=io.BytesIO(raw), mode="r:") as tar:
+            extracted = {
+                member.name: tar.extractfile(member).read()
+                for member in tar if member.isfile()
+            }
+        self.assertEqual(extracted.keys(), expected.keys())
+        for name, content in expected.items():
+            self.assertEqual(extracted[name], content, name)
+
+
+class PartialOutputTest(unittest.IsolatedAsyncioTestCase):
+    """Cleanup of the output file when compression fails"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.source = self.tmp / "data.txt"
+        self.source.write_bytes(b"payload\n" * 1000)
+        self.output = self.tmp / "archive.tar.gz"
+        self.output.write_bytes(b"existing archive")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    async def test_failed_open_keeps_existing_file(self):
+        def failing_open(file, mode='r', *args, **kwargs):
+            if 'w' in mode:
+                raise PermissionError(13, "Permission denied", str(file))
+            return open(file, mode, *args, **kwargs)
+
+        processor = AsyncTarProcessor(
+            CompressionType.GZIP, threads=1, console=Console(file=io.StringIO())
+        )
+        with mock.patch.object(tar_compressor, "open", failing_open, create=True):
+            self.assertFalse(await processor.compress_with_progress([self.source], self.output))
+            self.assertFalse(await processor.compress_sources_parallel([self.source], self.output, workers=1))
+
+        self.assertEqual(self.output.read_bytes(), b"existing archive")
+
+    async def test_failed_write_removes_output(self):
+        processor = AsyncTarProcessor(
+            CompressionType.GZIP, threads=1, console=Console(file=io.StringIO())
+        )
+        with mock.patch.object(processor, "_add_file_with_progress", side_effect=OSError("disk full")):
+            self.assertFalse(await processor.compress_with_progress([self.source], self.output))
+
+        self.assertFalse(self.output.exists())
+
+
+class HardlinkExtractionTest(unittest.IsolatedAsyncioTestCase):
+    """Hard link members extracted again into the same directory"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.source = self.tmp / "src"
+        self.source.mkdir()
+        (self.source / "target.txt").write_bytes(b"linked content\n" * 100)
+        os.link(self.source / "target.txt", self.source / "link.txt")
+        self.output = self.tmp / "out"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    async def _extract_twice(self, compression: CompressionType, suffix: str):
+        archive = self.tmp / f"archive.tar.{suffix}"
+        processor = AsyncTarProcessor(compression, console=Console(file=io.StringIO()))
+        self.assertTrue(await processor.compress_with_progress([self.source], archive))
+
+        # The second pass finds both paths already there
+        for _ in range(2):
+            processor = AsyncTarProcessor(console=Console(file=io.StringIO()))
+            self.assertTrue(await processor.decompress_with_progress(archive, self.output))
+
+        expected = (self.source / "target.txt").read_bytes()
+        self.assertEqual((self.output / "target.txt").read_bytes(), expected)
+        self.assertEqual((self.output / "link.txt").read_bytes(), expected)
+
+    async def test_gzip(self):
+        await self._extract_twice(CompressionType.GZIP, "gz")
+        self.assertTrue((self.output / "link.txt").samefile(self.output / "target.txt"))
+
+    async def test_gzip_without_hardlink_support(self):
+        with mock.patch.object(tar_compressor.os, "link", side_effect=OSError("not supported")):
+            await self._extract_twice(CompressionType.GZIP, "gz")
+
+    @unittest.skipUnless(tar_compressor.HAS_LZ4, "lz4 not installed")
+    async def test_lz4(self):
+        await self._extract_twice(CompressionType.LZ4, "lz4")
+
+    @unittest.skipUnless(tar_compressor.HAS_ZSTD, "zstandard not installed")
+    async def test_zstd(self):
+        await self._extract_twice(CompressionType.ZSTD, "zst")
+
+
+if __name__ == "__main__":
+    unittest.main()